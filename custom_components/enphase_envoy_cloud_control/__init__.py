@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from datetime import timedelta
 from typing import Any
 
 import voluptuous as vol
@@ -19,7 +18,7 @@ from homeassistant.helpers.event import async_call_later
 
 from .const import DEFAULT_POLL_INTERVAL, DOMAIN
 from .coordinator import EnphaseCoordinator
-from .editor import default_editor_state, default_new_editor_state
+from .editor import collect_schedules, default_editor_state, default_new_editor_state
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -198,7 +197,7 @@ async def _async_handle_options_update(hass: HomeAssistant, entry: ConfigEntry)
         )
         poll_interval = DEFAULT_POLL_INTERVAL
 
-    coordinator.update_interval = timedelta(seconds=poll_interval)
+    coordinator.set_poll_interval(poll_interval)
     _LOGGER.info("[Enphase] Polling interval updated to %ss via options.", poll_interval)
 
     # Trigger a refresh so the new interval is respected immediately.
@@ -441,7 +440,7 @@ def _register_services(hass: HomeAssistant) -> None:
 
         schedule_modes: dict[str, str] = {}
         for mode in ("cfg", "dtg", "rbd"):
-            for sched in _collect_schedules(coordinator, mode):
+            for sched in collect_schedules(coordinator, mode):
                 schedule_id = sched.get("scheduleId")
                 if schedule_id is None:
                     continue
@@ -460,7 +459,7 @@ def _register_services(hass: HomeAssistant) -> None:
         known_ids = {
             str(sched.get("scheduleId"))
             for sensor in ("cfg", "dtg", "rbd")
-            for sched in _collect_schedules(coordinator, sensor)
+            for sched in collect_schedules(coordinator, sensor)
             if sched.get("scheduleId") is not None
         }
 
@@ -471,16 +470,10 @@ def _register_services(hass: HomeAssistant) -> None:
                     f"Schedule ID(s) not found in current data: {', '.join(unknown_ids)}"
                 )
 
-        for schedule_id in schedule_ids:
-            try:
-                await hass.async_add_executor_job(
-                    coordinator.client.delete_schedule, schedule_id
-                )
-            except Exception as exc:
-                _LOGGER.error("[Enphase] Failed to delete schedule %s: %s", schedule_id, exc)
-                raise HomeAssistantError(
-                    f"Failed to delete schedule {schedule_id}: {exc}"
-                ) from exc
+        results = await hass.async_add_executor_job(
+            coordinator.client.delete_schedules_bulk, schedule_ids
+        )
+        await _async_raise_on_delete_failures(coordinator, schedule_ids, results)
 
         affected_modes = {
             schedule_modes[sched_id]
@@ -632,6 +625,34 @@ async def _post_action_refresh(coordinator: EnphaseCoordinator) -> None:
         _LOGGER.warning("[Enphase] Post-action refresh failed: %s", exc)
 
 
+async def _async_raise_on_delete_failures(
+    coordinator: EnphaseCoordinator, schedule_ids: list[str], results: list[Any]
+) -> None:
+    """Raise if any delete in a bulk request failed.
+
+    The deletes run concurrently, so the ones that succeeded are already gone
+    from the cloud; refresh first so entities do not keep showing them.
+    """
+    failures = [
+        (schedule_id, result)
+        for schedule_id, result in zip(schedule_ids, results)
+        if isinstance(result, Exception)
+    ]
+    if not failures:
+        return
+    for schedule_id, exc in failures:
+        _LOGGER.error("[Enphase] Failed to delete schedule %s: %s", schedule_id, exc)
+    await _post_action_refresh(coordinator)
+
+    failed_ids = {schedule_id for schedule_id, _ in failures}
+    deleted = [schedule_id for schedule_id in schedule_ids if schedule_id not in failed_ids]
+    schedule_id, exc = failures[0]
+    message = f"Failed to delete schedule {schedule_id}: {exc}"
+    if deleted:
+        message += f" (deleted: {', '.join(deleted)})"
+    raise HomeAssistantError(message) from exc
+
+
 def _schedule_post_action_refresh(
     hass: HomeAssistant, coordinator: EnphaseCoordinator
 ) -> None:
@@ -641,38 +662,6 @@ def _schedule_post_action_refresh(
     )
 
 
-def _collect_schedules(coordinator: EnphaseCoordinator, mode: str) -> list[dict[str, Any]]:
-    """Collect cached schedules for the given mode."""
-    data_root = coordinator.data or {}
-    schedule_block = data_root.get("data", {}).get(f"{mode}Control", {})
-    schedules = schedule_block.get("schedules")
-    if isinstance(schedules, list):
-        return schedules
-
-    fallback = data_root.get("schedules", {})
-    if isinstance(fallback, dict):
-        candidate = fallback.get(mode)
-        if isinstance(candidate, dict) and isinstance(candidate.get("details"), list):
-            return candidate["details"]
-        if isinstance(candidate, list):
-            return candidate
-        inner = fallback.get("data", {}).get(mode)
-        if isinstance(inner, dict) and isinstance(inner.get("details"), list):
-            return inner["details"]
-        if isinstance(inner, list):
-            return inner
-
-    cached = getattr(coordinator.client, "_last_schedules", None)
-    if isinstance(cached, dict):
-        candidate = cached.get(mode)
-        if isinstance(candidate, dict) and isinstance(candidate.get("details"), list):
-            return candidate["details"]
-        if isinstance(candidate, list):
-            return candidate
-
-    return []
-
-
 def _mode_settings_from_data(
     coordinator: EnphaseCoordinator, mode: str
 ) -> dict[str, Any]:
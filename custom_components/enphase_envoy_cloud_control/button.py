@@ -34,6 +34,7 @@ class EnphaseForceCloudRefreshButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self._attr_name = "Force Cloud Refresh"
         self._attr_unique_id = f"{coordinator.entry.entry_id}_force_refresh"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
         self._attr_icon = "mdi:refresh"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -50,11 +51,6 @@ class EnphaseForceCloudRefreshButton(CoordinatorEntity, ButtonEntity):
         except Exception as e:
             _LOGGER.error("[Enphase] Data refresh failed: %s", e)
 
-    @property
-    def device_info(self):
-        """Attach this button to the Enphase device."""
-        return battery_device_info(self.coordinator.entry.entry_id)
-
 
 class EnphaseAddScheduleButton(CoordinatorEntity, ButtonEntity):
     """Button that opens the schedule creation dialog."""
@@ -66,6 +62,7 @@ class EnphaseAddScheduleButton(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_add_schedule"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
 
     async def async_press(self) -> None:
         """Launch the options flow for adding a schedule."""
@@ -96,10 +93,6 @@ class EnphaseAddScheduleButton(CoordinatorEntity, ButtonEntity):
                 notification_id=f"{DOMAIN}_schedule_add_flow",
             )
 
-    @property
-    def device_info(self):
-        return battery_device_info(self.coordinator.entry.entry_id)
-
 
 class EnphaseDeleteScheduleButton(CoordinatorEntity, ButtonEntity):
     """Button that opens the schedule deletion dialog."""
@@ -111,6 +104,7 @@ class EnphaseDeleteScheduleButton(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_delete_schedule"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
 
     async def async_press(self) -> None:
         """Launch the options flow for deleting a schedule."""
@@ -141,10 +135,6 @@ class EnphaseDeleteScheduleButton(CoordinatorEntity, ButtonEntity):
                 notification_id=f"{DOMAIN}_schedule_delete_flow",
             )
 
-    @property
-    def device_info(self):
-        return battery_device_info(self.coordinator.entry.entry_id)
-
 
 class EnphaseScheduleSaveButton(ButtonEntity):
     """Button to save edits to an existing schedule."""
@@ -156,6 +146,7 @@ class EnphaseScheduleSaveButton(ButtonEntity):
     def __init__(self, entry_id: str):
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_schedule_save"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
 
     async def async_press(self) -> None:
         entry_data = get_entry_data(self.hass, self.entry_id)
@@ -181,10 +172,6 @@ class EnphaseScheduleSaveButton(ButtonEntity):
             blocking=True,
         )
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
-
 
 class EnphaseScheduleDeleteButton(ButtonEntity):
     """Button to delete the selected schedule."""
@@ -196,6 +183,7 @@ class EnphaseScheduleDeleteButton(ButtonEntity):
     def __init__(self, entry_id: str):
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_schedule_delete"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
 
     async def async_press(self) -> None:
         entry_data = get_entry_data(self.hass, self.entry_id)
@@ -214,10 +202,6 @@ class EnphaseScheduleDeleteButton(ButtonEntity):
             blocking=True,
         )
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
-
 
 class EnphaseNewScheduleAddButton(ButtonEntity):
     """Button to add a new schedule from editor state."""
@@ -229,6 +213,7 @@ class EnphaseNewScheduleAddButton(ButtonEntity):
     def __init__(self, entry_id: str):
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_new_schedule_add"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
 
     async def async_press(self) -> None:
         entry_data = get_entry_data(self.hass, self.entry_id)
@@ -248,10 +233,6 @@ class EnphaseNewScheduleAddButton(ButtonEntity):
             blocking=True,
         )
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
-
 
 class EnphaseStartTimedModeButton(CoordinatorEntity, ButtonEntity):
     """Button to start a timed battery mode."""
@@ -262,6 +243,7 @@ class EnphaseStartTimedModeButton(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_start_timed_mode"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
 
     async def async_press(self) -> None:
         from .timed_mode import enable_timed_mode
@@ -290,10 +272,6 @@ class EnphaseStartTimedModeButton(CoordinatorEntity, ButtonEntity):
         _LOGGER.info("[Enphase] Start Timed Mode: %s for %d min", mode, duration)
         await enable_timed_mode(self.hass, entry_id, mode, duration)
 
-    @property
-    def device_info(self):
-        return battery_device_info(self.coordinator.entry.entry_id)
-
 
 class EnphaseCancelTimedModeButton(CoordinatorEntity, ButtonEntity):
     """Button to cancel an active timed battery mode."""
@@ -304,6 +282,7 @@ class EnphaseCancelTimedModeButton(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_cancel_timed_mode"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
 
     async def async_press(self) -> None:
         from .timed_mode import get_active_timed_mode, cancel_timed_mode
@@ -316,7 +295,3 @@ class EnphaseCancelTimedModeButton(CoordinatorEntity, ButtonEntity):
         mode = active["mode"]
         _LOGGER.info("[Enphase] Cancelling timed %s mode.", mode)
         await cancel_timed_mode(self.hass, entry_id, mode, disable_mode=True)
-
-    @property
-    def device_info(self):
-        return battery_device_info(self.coordinator.entry.entry_id)
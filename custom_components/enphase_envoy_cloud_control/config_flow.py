@@ -8,6 +8,13 @@ from .options_flow import EnphaseOptionsFlowHandler
 
 _LOGGER = logging.getLogger(__name__)
 
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required("email"): str,
+        vol.Required("password"): str,
+    }
+)
+
 
 class EnphaseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the configuration flow for Enphase Envoy Cloud Control."""
@@ -33,15 +40,8 @@ class EnphaseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     title="Enphase Envoy Cloud Control", data=user_input
                 )
 
-        data_schema = vol.Schema(
-            {
-                vol.Required("email"): str,
-                vol.Required("password"): str,
-            }
-        )
-
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="user", data_schema=_USER_SCHEMA, errors=errors
         )
 
     @staticmethod
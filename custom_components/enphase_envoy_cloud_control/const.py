@@ -27,6 +27,10 @@ CONF_SITE_ID = "site_id"
 
 # Defaults
 DEFAULT_POLL_INTERVAL = 30
+# Upper bound (seconds) for the polling interval while backing off after failures
+MAX_POLL_BACKOFF = 900
+# Seconds to let the cloud apply a mode change before polling it again
+MODE_CHANGE_SETTLE_SECONDS = 5
 
 # Cache path
 CACHE_DIR = ".cache"
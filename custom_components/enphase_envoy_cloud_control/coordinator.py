@@ -1,9 +1,12 @@
 from __future__ import annotations
+import asyncio
+import time
 from datetime import timedelta, datetime, timezone
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from .const import LOGGER, DEFAULT_POLL_INTERVAL
+from .const import LOGGER, DEFAULT_POLL_INTERVAL, MAX_POLL_BACKOFF, MODE_CHANGE_SETTLE_SECONDS
 from .enphase_client import EnphaseClient
 
 _LOGGER = LOGGER
@@ -26,10 +29,15 @@ class EnphaseCoordinator(DataUpdateCoordinator):
         # ✅ Custom polling interval (default 30s)
         poll_interval = entry.options.get("poll_interval", DEFAULT_POLL_INTERVAL)
         self.update_interval = timedelta(seconds=poll_interval)
+        self._base_interval = self.update_interval
+        self._fail_count = 0
         _LOGGER.info(f"[Enphase] Polling interval set to {poll_interval}s")
 
-        self.last_refresh = None
-        self.last_successful_poll = None
+        # Wall-clock time of the last successful poll in nanoseconds; the
+        # datetime/ISO views below are only built when something reads them.
+        self._poll_ns: int | None = None
+        # Single-flight guard for entities that need schedules before the first poll.
+        self._schedules_fetch_lock = asyncio.Lock()
 
         super().__init__(
             hass,
@@ -38,38 +46,98 @@ class EnphaseCoordinator(DataUpdateCoordinator):
             update_interval=self.update_interval,
         )
 
+        # Rapid mode toggles share a single refresh, fired once the cloud has
+        # had time to apply the last change.
+        self._settle_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=MODE_CHANGE_SETTLE_SECONDS,
+            immediate=False,
+            function=self.async_force_refresh,
+        )
+
     async def _async_update_data(self):
         """Fetch latest data from Enphase Cloud."""
         try:
             _LOGGER.debug("[Enphase] Starting scheduled data update.")
-            data = await self.hass.async_add_executor_job(self._fetch)
-            self.last_successful_poll = datetime.now(timezone.utc)
-            self.last_refresh = self.last_successful_poll.isoformat()
+            data = await self._async_fetch()
+            self._poll_ns = time.time_ns()
+            if self._fail_count:
+                self._fail_count = 0
+                self.update_interval = self._base_interval
             return data
         except Exception as err:
             _LOGGER.error("[Enphase] Error updating data: %s", err)
+            self._back_off()
             raise UpdateFailed(err)
 
-    def _fetch(self):
-        """Synchronous fetch — runs inside executor."""
+    def set_poll_interval(self, seconds: int) -> None:
+        """Set the normal polling interval (e.g. from the options flow)."""
+        self._base_interval = timedelta(seconds=seconds)
+        self._fail_count = 0
+        self.update_interval = self._base_interval
+
+    def _back_off(self) -> None:
+        """Exponentially stretch the polling interval after a failed update."""
+        self._fail_count += 1
+        base = self._base_interval.total_seconds()
+        # Clamp the exponent: the cap is reached long before 2**16, and an
+        # unbounded power overflows float conversion after ~1024 failures.
+        delay = min(base * 2 ** min(self._fail_count, 16), max(base, MAX_POLL_BACKOFF))
+        self.update_interval = timedelta(seconds=delay)
+        _LOGGER.debug(
+            "[Enphase] Update failed %d time(s); next poll in %ss.",
+            self._fail_count,
+            int(delay),
+        )
+
+    @property
+    def last_successful_poll(self) -> datetime | None:
+        """Return the time of the last successful poll (UTC)."""
+        if self._poll_ns is None:
+            return None
+        return datetime.fromtimestamp(self._poll_ns / 1e9, tz=timezone.utc)
+
+    @property
+    def last_refresh(self) -> str | None:
+        """Return the last successful poll as an ISO 8601 string."""
+        poll = self.last_successful_poll
+        return poll.isoformat() if poll else None
+
+    async def _async_fetch(self):
+        """Fetch battery settings and schedules concurrently.
+
+        Tokens are validated once up front so the two parallel requests
+        never race each other into a re-login.
+        """
+        try:
+            await self.hass.async_add_executor_job(self.client.ensure_authenticated)
+            battery_data, schedules = await asyncio.gather(
+                self.hass.async_add_executor_job(self.client.battery_settings),
+                self.hass.async_add_executor_job(self.client.get_schedules),
+            )
+        except Exception as e:
+            _LOGGER.warning("[Enphase] Coordinator fetch failed: %s", e)
+            raise
+        return self._merge(battery_data, schedules)
+
+    def _merge(self, battery_data, schedules):
+        """Combine battery settings and schedules into coordinator data."""
         try:
-            battery_data = self.client.battery_settings() or {}
-            schedules = self.client.get_schedules() or {}
+            # The client already strips the outer "data" wrapper from both
+            # payloads, so these are the control and schedule blocks.
+            inner_data = battery_data or {}
+            schedules = schedules or {}
 
             # Persist the last schedule payload for entities that reference it
             # outside of the coordinator data structure (legacy behaviour).
             setattr(self.client, "_last_schedules", schedules)
 
-            # Normalise schedule payload to the inner "data" block when present.
-            schedule_block = schedules.get("data") if isinstance(schedules, dict) else None
-            if not schedule_block:
-                schedule_block = schedules if isinstance(schedules, dict) else {}
-
-            inner_data = battery_data.get("data", battery_data)
+            schedule_block = schedules if isinstance(schedules, dict) else {}
 
             # Merge concrete schedule details (start/end, limit, etc.) into the
             # cfg/dtg/rbd control blocks so entities always read fresh values.
-            if isinstance(inner_data, dict) and isinstance(schedule_block, dict):
+            if isinstance(inner_data, dict):
                 for mode in ("cfg", "dtg", "rbd"):
                     details = schedule_block.get(mode)
                     if not isinstance(details, dict):
@@ -100,12 +168,11 @@ class EnphaseCoordinator(DataUpdateCoordinator):
             merged = {
                 "data": inner_data,
                 "schedules": schedule_block,
-                "schedules_raw": schedules,
             }
             _LOGGER.debug("[Enphase] Data fetch complete. Keys: %s", list(merged.keys()))
             return merged
         except Exception as e:
-            _LOGGER.warning("[Enphase] Coordinator fetch failed: %s", e)
+            _LOGGER.warning("[Enphase] Coordinator data merge failed: %s", e)
             raise
 
     async def async_force_refresh(self):
@@ -113,9 +180,40 @@ class EnphaseCoordinator(DataUpdateCoordinator):
         _LOGGER.info("[Enphase] Manual cloud refresh requested.")
         await self.async_request_refresh()
 
+    async def async_ensure_schedules_loaded(self) -> None:
+        """Fetch schedules once for entities that found none in the coordinator data.
+
+        Concurrent callers share one request; later callers see the cached
+        payload and return without hitting the cloud. A failed fetch is
+        recorded as ``None`` so it is not retried before the next poll, which
+        replaces the cache either way.
+        """
+        if hasattr(self.client, "_last_schedules"):
+            return
+        async with self._schedules_fetch_lock:
+            if hasattr(self.client, "_last_schedules"):
+                return
+            try:
+                schedules = await self.hass.async_add_executor_job(self.client.get_schedules)
+            except Exception as e:
+                _LOGGER.warning("[Enphase] Background schedule fetch failed: %s", e)
+                self.client._last_schedules = None
+                return
+            self.client._last_schedules = schedules
+        # coordinator.data is unchanged, so entities must be told to re-read.
+        self.async_update_listeners()
+
+    async def async_request_settled_refresh(self) -> None:
+        """Schedule a refresh after a mode change, coalescing rapid toggles."""
+        await self._settle_debouncer.async_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending post-toggle refresh before shutting down."""
+        self._settle_debouncer.async_cancel()
+        await super().async_shutdown()
+
     async def async_initialize_auth(self) -> None:
         """Ensure authentication is ready and persist discovered IDs."""
-        await self.hass.async_add_executor_job(self.client.load_cache)
         ids = await self.hass.async_add_executor_job(self.client.ensure_authenticated)
         if not ids:
             return
@@ -124,7 +222,8 @@ class EnphaseCoordinator(DataUpdateCoordinator):
         changed = False
         for key in ("user_id", "battery_id"):
             value = ids.get(key)
-            if value and not updated.get(key):
+            # Only numeric IDs are stored; a malformed stored one is replaced.
+            if value and str(value).isdigit() and not str(updated.get(key) or "").isdigit():
                 updated[key] = value
                 changed = True
 
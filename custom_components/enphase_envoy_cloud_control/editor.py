@@ -20,6 +20,9 @@ DAY_ORDER: list[tuple[str, int]] = [
 ]
 DAY_KEY_BY_INDEX = {index: key for key, index in DAY_ORDER}
 
+_RE_EMBEDDED_HHMM = re.compile(r"(\d{2}:\d{2})")
+_RE_DAY_SEPARATORS = re.compile(r"[,\s]+")
+
 
 def default_day_flags() -> dict[str, bool]:
     """Return day flag defaults (all false)."""
@@ -59,6 +62,25 @@ def get_coordinator(hass, entry_id: str) -> EnphaseCoordinator:
     return get_entry_data(hass, entry_id)["coordinator"]
 
 
+class EditorStateMixin:
+    """Entity mixin that resolves its editor state dict once.
+
+    The editor dicts are created with the config entry and only mutated in
+    place, so entities can hold the reference instead of walking hass.data
+    on every read and write.
+    """
+
+    entry_id: str
+    _editor_key: str
+    _editor_ref: dict[str, Any] | None = None
+
+    @property
+    def _editor(self) -> dict[str, Any]:
+        if self._editor_ref is None:
+            self._editor_ref = get_entry_data(self.hass, self.entry_id)[self._editor_key]
+        return self._editor_ref
+
+
 def editor_days_from_list(days: list[int]) -> dict[str, bool]:
     """Convert list of ints into editor day flags."""
     flags = default_day_flags()
@@ -82,7 +104,7 @@ def _normalize_time(value: Any) -> str:
     if isinstance(value, (int, float)):
         return f"{int(value):02d}:00"
     value_str = str(value)
-    match = re.search(r"(\d{2}:\d{2})", value_str)
+    match = _RE_EMBEDDED_HHMM.search(value_str)
     if match:
         return match.group(1)
     return value_str[:5]
@@ -100,7 +122,7 @@ def _normalize_days(raw: Any) -> list[int]:
     if isinstance(raw, (list, tuple, set)):
         values = list(raw)
     else:
-        values = re.split(r"[,\s]+", str(raw))
+        values = _RE_DAY_SEPARATORS.split(str(raw))
     days: list[int] = []
     for value in values:
         try:
@@ -112,12 +134,15 @@ def _normalize_days(raw: Any) -> list[int]:
     return sorted(set(days))
 
 
-def _collect_schedules(coordinator: EnphaseCoordinator, mode: str) -> list[dict[str, Any]]:
+def collect_schedules(coordinator: EnphaseCoordinator, mode: str) -> list[dict[str, Any]]:
+    """Return the raw schedules for *mode*, falling back to the client's last fetch."""
     data_root = coordinator.data or {}
-    schedule_block = data_root.get("data", {}).get(f"{mode}Control", {})
-    schedules = schedule_block.get("schedules")
-    if isinstance(schedules, list):
-        return schedules
+    schedule_block = data_root.get("data", {}).get(f"{mode}Control")
+    # The cloud reports a disabled mode as ``"<mode>Control": null``.
+    if isinstance(schedule_block, dict):
+        schedules = schedule_block.get("schedules")
+        if isinstance(schedules, list):
+            return schedules
 
     fallback = data_root.get("schedules", {})
     if isinstance(fallback, dict):
@@ -147,7 +172,7 @@ def normalize_schedules(coordinator: EnphaseCoordinator) -> list[dict[str, Any]]
     """Return normalized schedules for all modes."""
     normalized: list[dict[str, Any]] = []
     for mode in ("cfg", "dtg", "rbd"):
-        for schedule in _collect_schedules(coordinator, mode):
+        for schedule in collect_schedules(coordinator, mode):
             schedule_id = schedule.get("scheduleId")
             if schedule_id is None:
                 continue
@@ -1,15 +1,103 @@
 from __future__ import annotations
 import base64
+import contextlib
+import functools
+from html.parser import HTMLParser
 import logging
 import os
 import json
 import re
-from datetime import datetime, timezone
-from typing import Any
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
-SESSION = requests.Session()
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the stdlib exception.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _build_session() -> requests.Session:
+    """Create the shared session with a keep-alive pool sized for our hosts."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            # POST is left out: replaying add_schedule after a gateway error
+            # could create the same schedule twice.
+            allowed_methods=frozenset({"GET", "PUT"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+_RE_SITE_ID = re.compile(r"/(web|pv/systems|systems)/([0-9]+)")
+_RE_HHMM = re.compile(r"^(\d{1,2}):(\d{2})$")
+
+_VALID_MODES = frozenset(
+    {"cfg", "dtg", "rbd", "cfgControl", "dtgControl", "rbdControl"}
+)
+
+# Statuses that mean our tokens were rejected; answered by one refresh + retry.
+_AUTH_REJECTED = frozenset({401, 403})
+
+_API_BASE = "https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1"
+
+# Header sets that never change between calls; per-request auth values are
+# layered on top by EnphaseClient._auth_headers().
+_JSON_HEADERS = {"content-type": "application/json"}
+_BP_UI_HEADERS = {
+    **_JSON_HEADERS,
+    "origin": "https://battery-profile-ui.enphaseenergy.com",
+    "referer": "https://battery-profile-ui.enphaseenergy.com/",
+}
+_DELETE_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
+    **_BP_UI_HEADERS,
+    "user-agent": "curl/8.14.1",
+}
+
+# Concurrent requests used by the bulk schedule helpers; stays well within
+# the adapter's pool_maxsize so workers never wait for a connection.
+BULK_MAX_WORKERS = 8
+
+# Refresh the XSRF token proactively once it is this old (seconds), rather
+# than waiting for the API to answer 403.
+XSRF_TTL_SECONDS = 30 * 60
+
+# After a full token check passes, skip re-checking for this long (seconds).
+TOKEN_RECHECK_SECONDS = 5 * 60
+
+# Cookies are persisted only for Enphase hosts and restored onto this domain.
+_COOKIE_DOMAIN = "enlighten.enphaseenergy.com"
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
 CACHE_FILE = os.path.join(CACHE_DIR, "auth.json")
@@ -19,18 +107,100 @@ class AuthError(Exception):
     """Authentication or token error."""
 
 
+class _AuthTokenParser(HTMLParser):
+    """Pick the ``authenticity_token`` hidden input out of the login page."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.token: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.token is None and tag == "input":
+            values = dict(attrs)
+            if values.get("name") == "authenticity_token" and values.get("value"):
+                self.token = values["value"]
+
+
+def _b64url_decode(data: str) -> str:
+    pad = (-len(data)) % 4
+    try:
+        return base64.urlsafe_b64decode(data + "=" * pad).decode("utf-8")
+    except Exception:
+        return ""
+
+
+@functools.lru_cache(maxsize=16)
+def _jwt_payload_json(jwt: str) -> dict[str, Any]:
+    """Decode a JWT's payload; cached per token string, so treat as read-only."""
+    try:
+        payload = jwt.split(".")[1]
+    except IndexError:
+        return {}
+    decoded = _b64url_decode(payload)
+    if not decoded:
+        return {}
+    try:
+        return _json_loads(decoded)
+    except json.JSONDecodeError:
+        return {}
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a response body straight from its raw bytes."""
+    return _json_loads(response.content)
+
+
+def _numeric_id(value: Any) -> str | None:
+    """Return *value* as a string if it is a usable numeric site/user ID."""
+    if value is None:
+        return None
+    value = str(value)
+    return value if value.isdigit() else None
+
+
+def _unwrap_data(payload: Any) -> Any:
+    """Return the inner ``data`` block of an API payload when present."""
+    if isinstance(payload, dict):
+        return payload.get("data", payload)
+    return payload
+
+
 class EnphaseClient:
     """Handles Enphase Cloud authentication and API calls."""
 
     def __init__(self, email: str, password: str, user_id: str | None, battery_id: str | None):
         self.email = email
         self.password = password
-        self.user_id = user_id
-        self.battery_id = battery_id
+        # Malformed stored IDs are dropped here so discovery replaces them once.
+        self.user_id = _numeric_id(user_id)
+        self.battery_id = _numeric_id(battery_id)
         self.jwt_token: str | None = None
         self.xsrf_token: str | None = None
         self.cookies: dict | None = None
         self.jwt_exp: int | None = None
+        # Monotonic time the XSRF token was obtained; None if loaded from cache.
+        self._xsrf_fetched_at: float | None = None
+        # Monotonic deadline until which the last token check is trusted.
+        self._tokens_ok_until = 0.0
+        # ((battery_id, user_id), (settings_url, schedules_url, is_valid_url))
+        self._url_cache: tuple[tuple[Any, Any], tuple[str, str, str]] | None = None
+        # Set whenever tokens/IDs change so the cache is only rewritten then.
+        self._cache_dirty = False
+        self._last_cache_json: bytes | None = None
+        # The cache file is read on first use rather than at construction.
+        self._cache_loaded = False
+        # Serialises token refreshes when several requests run in parallel.
+        self._auth_lock = threading.RLock()
+
+    @property
+    def user_id(self) -> str | None:
+        return self._user_id
+
+    @user_id.setter
+    def user_id(self, value: str | None) -> None:
+        # The string form is sent as the "username" header on every request.
+        self._user_id = value
+        self._username = str(value)
 
     # -------------------------------------------------------------------------
     # CACHE
@@ -38,38 +208,62 @@ class EnphaseClient:
 
     def load_cache(self):
         """Load cached JWT/XSRF tokens if present."""
+        self._cache_loaded = True
         try:
-            if os.path.exists(CACHE_FILE):
-                with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.jwt_token = data.get("jwt")
-                    self.xsrf_token = data.get("xsrf")
-                    self.cookies = data.get("cookies")
-                    self.jwt_exp = data.get("jwt_exp")
-                    if not self.user_id:
-                        self.user_id = data.get("user_id")
-                    if not self.battery_id:
-                        self.battery_id = data.get("battery_id")
-                    if isinstance(self.cookies, dict):
-                        SESSION.cookies.update(self.cookies)
-                    _LOGGER.debug("[Enphase] Loaded cached tokens")
+            with open(CACHE_FILE, "rb") as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            _LOGGER.warning("[Enphase] Failed to load cache: %s", exc)
+            return
+        try:
+            self.jwt_token = data.get("jwt")
+            self.xsrf_token = data.get("xsrf")
+            self.cookies = data.get("cookies")
+            self.jwt_exp = data.get("jwt_exp")
+            if not self.user_id:
+                self.user_id = _numeric_id(data.get("user_id"))
+            if not self.battery_id:
+                self.battery_id = _numeric_id(data.get("battery_id"))
+            if isinstance(self.cookies, dict):
+                for name, value in self.cookies.items():
+                    SESSION.cookies.set(name, value, domain=_COOKIE_DOMAIN, path="/")
+            _LOGGER.debug("[Enphase] Loaded cached tokens")
         except Exception as exc:
             _LOGGER.warning("[Enphase] Failed to load cache: %s", exc)
 
     def _save_cache(self):
-        """Persist JWT/XSRF tokens."""
+        """Persist JWT/XSRF tokens atomically, skipping unchanged content."""
         try:
-            os.makedirs(CACHE_DIR, exist_ok=True)
             data = {
                 "jwt": self.jwt_token,
                 "xsrf": self.xsrf_token,
-                "cookies": requests.utils.dict_from_cookiejar(SESSION.cookies),
+                "cookies": {
+                    c.name: c.value
+                    for c in SESSION.cookies
+                    if c.domain.endswith("enphaseenergy.com")
+                },
                 "jwt_exp": self.jwt_exp,
                 "user_id": self.user_id,
                 "battery_id": self.battery_id,
             }
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+            serialized = _json_dumps(data)
+            if serialized == self._last_cache_json:
+                self._cache_dirty = False
+                return
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(serialized)
+                os.replace(tmp_path, CACHE_FILE)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+            self._last_cache_json = serialized
+            self._cache_dirty = False
             _LOGGER.debug("[Enphase] Cache saved.")
         except Exception as exc:
             _LOGGER.warning("[Enphase] Failed to save cache: %s", exc)
@@ -83,12 +277,19 @@ class EnphaseClient:
         r = SESSION.get("https://enlighten.enphaseenergy.com/login", timeout=30)
         if not r.ok:
             raise AuthError("Failed to access login page.")
-        match = re.search(
-            r'name=["\']authenticity_token["\'][^>]*value=["\']([^"\']+)["\']', r.text
-        )
-        if not match:
+        parser = _AuthTokenParser()
+        # requests reports ISO-8859-1 for text/html without a charset, and
+        # r.encoding is None only for other content types. The token is
+        # ASCII either way; a charset Python does not know falls back to
+        # UTF-8 instead of raising.
+        try:
+            html = r.content.decode(r.encoding or "utf-8", errors="replace")
+        except LookupError:
+            html = r.content.decode("utf-8", errors="replace")
+        parser.feed(html)
+        if not parser.token:
             raise AuthError("Could not find authenticity_token on login page.")
-        return match.group(1)
+        return parser.token
 
     def _login(self):
         """Perform login to retrieve JWT."""
@@ -115,69 +316,88 @@ class EnphaseClient:
         jwt_resp = SESSION.get(
             "https://enlighten.enphaseenergy.com/app-api/jwt_token.json", timeout=30
         )
-        jwt_json = jwt_resp.json()
+        jwt_json = _response_json(jwt_resp)
         jwt_token = jwt_json.get("token")
         if not jwt_token:
             raise AuthError("JWT not found in response.")
 
         self.jwt_token = jwt_token
         self.jwt_exp = self._jwt_exp(jwt_token)
+        self._cache_dirty = True
         _LOGGER.info("[Enphase] JWT retrieved successfully.")
 
-        self._discover_ids()
-        self._update_xsrf()
-        self._save_cache()
+        # The login redirect usually lands on the site page, and earlier
+        # responses may already have set the XSRF cookie; reuse both to save
+        # round-trips.
+        self._discover_ids(r.url)
+        if "BP-XSRF-Token" in SESSION.cookies:
+            self.xsrf_token = SESSION.cookies["BP-XSRF-Token"]
+            self._xsrf_fetched_at = time.monotonic()
+        else:
+            self._update_xsrf()
 
     def _update_xsrf(self):
         """Fetch new XSRF token using JWT."""
-        if not self.battery_id or not self.user_id:
-            self._discover_ids()
+        # Callers run _discover_ids() first; this only guards the request.
         if not self.battery_id or not self.user_id:
             raise AuthError("Missing battery/user IDs for XSRF request.")
 
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"battery/sites/{self.battery_id}/schedules/isValid"
-        )
+        url = self._api_urls()[2]
         headers = {
-            "content-type": "application/json",
-            "origin": "https://battery-profile-ui.enphaseenergy.com",
-            "referer": "https://battery-profile-ui.enphaseenergy.com/",
+            **_BP_UI_HEADERS,
             "e-auth-token": self.jwt_token,
-            "username": str(self.user_id),
+            "username": self._username,
         }
         payload = {"scheduleType": "dtg"}
         r = SESSION.post(url, json=payload, headers=headers, timeout=30)
-        if "BP-XSRF-Token" in SESSION.cookies:
-            self.xsrf_token = SESSION.cookies["BP-XSRF-Token"]
-        if not self.xsrf_token and "BP-XSRF-Token" in r.headers.get("Set-Cookie", ""):
-            match = re.search(r"BP-XSRF-Token=([^;]+)", r.headers["Set-Cookie"])
-            if match:
-                self.xsrf_token = match.group(1)
+        # requests has already parsed Set-Cookie into both jars.
+        xsrf = r.cookies.get("BP-XSRF-Token") or SESSION.cookies.get(
+            "BP-XSRF-Token", domain=_COOKIE_DOMAIN
+        )
+        if xsrf:
+            self.xsrf_token = xsrf
         if not self.xsrf_token:
             raise AuthError("Failed to retrieve XSRF token.")
         SESSION.cookies.set(
             "BP-XSRF-Token",
             self.xsrf_token,
-            domain="enlighten.enphaseenergy.com",
+            domain=_COOKIE_DOMAIN,
             path="/",
         )
+        self._xsrf_fetched_at = time.monotonic()
+        self._cache_dirty = True
         _LOGGER.debug("[Enphase] XSRF token updated.")
 
     def _ensure_tokens(self, force_refresh=False):
         """Ensure JWT/XSRF tokens are present and valid."""
+        if (
+            not force_refresh
+            and self.xsrf_token
+            and time.monotonic() < self._tokens_ok_until
+        ):
+            return self.jwt_token, self.xsrf_token
+        with self._auth_lock:
+            tokens = self._ensure_tokens_locked(force_refresh)
+            self._tokens_ok_until = time.monotonic() + TOKEN_RECHECK_SECONDS
+            return tokens
+
+    def _ensure_tokens_locked(self, force_refresh=False):
+        if not self._cache_loaded:
+            self.load_cache()
         needs_login = force_refresh or not self._jwt_valid()
         if needs_login or not self._cookies_present():
             _LOGGER.info("[Enphase] Refreshing authentication tokens.")
             self._login()
         else:
-            if not self.user_id or not self.battery_id:
-                self._discover_ids()
+            # Safety net: IDs normally come from the config entry or cache,
+            # in which case this returns immediately.
+            self._discover_ids()
 
-        if not self.xsrf_token:
+        if not self.xsrf_token or self._xsrf_expired():
             self._update_xsrf()
 
-        self._save_cache()
+        if self._cache_dirty:
+            self._save_cache()
         return self.jwt_token, self.xsrf_token
 
     def ensure_authenticated(self) -> dict[str, str | None]:
@@ -185,6 +405,12 @@ class EnphaseClient:
         self._ensure_tokens()
         return {"user_id": self.user_id, "battery_id": self.battery_id}
 
+    def _xsrf_expired(self) -> bool:
+        """Return True once a freshly fetched XSRF token has outlived its TTL."""
+        if self._xsrf_fetched_at is None:
+            return False
+        return time.monotonic() - self._xsrf_fetched_at > XSRF_TTL_SECONDS
+
     def _cookies_present(self) -> bool:
         return bool(SESSION.cookies)
 
@@ -195,7 +421,7 @@ class EnphaseClient:
         if not exp:
             return False
         self.jwt_exp = exp
-        now = int(datetime.now(timezone.utc).timestamp())
+        now = int(time.time())
         return exp > (now + 3600)
 
     def _jwt_exp(self, jwt: str) -> int | None:
@@ -206,36 +432,29 @@ class EnphaseClient:
         return None
 
     def _jwt_payload_json(self, jwt: str) -> dict[str, Any]:
-        try:
-            payload = jwt.split(".")[1]
-        except IndexError:
-            return {}
-        decoded = self._b64url_decode(payload)
-        if not decoded:
-            return {}
-        try:
-            return json.loads(decoded)
-        except json.JSONDecodeError:
-            return {}
+        return _jwt_payload_json(jwt)
 
     def _b64url_decode(self, data: str) -> str:
-        data = data.replace("_", "/").replace("-", "+")
-        pad = (4 - len(data) % 4) % 4
-        data = data + ("=" * pad)
-        try:
-            return base64.b64decode(data).decode("utf-8")
-        except Exception:
-            return ""
-
-    def _discover_ids(self) -> None:
-        """Auto-discover numeric battery/site ID and user ID."""
-        final_url = SESSION.get(
-            "https://enlighten.enphaseenergy.com/",
-            timeout=30,
-            allow_redirects=True,
-        ).url
+        return _b64url_decode(data)
 
-        match = re.search(r"/(web|pv/systems|systems)/([0-9]+)", final_url)
+    def _discover_ids(self, landing_url: str | None = None) -> None:
+        """Auto-discover numeric battery/site ID and user ID.
+
+        *landing_url* is a URL already reached after login; when it carries
+        the site ID the extra request to the Enlighten home page is skipped.
+        Does nothing when both IDs are already known.
+        """
+        if self.user_id and self.battery_id:
+            return
+        match = _RE_SITE_ID.search(landing_url) if landing_url else None
+        final_url = landing_url
+        if not match:
+            final_url = SESSION.get(
+                "https://enlighten.enphaseenergy.com/",
+                timeout=30,
+                allow_redirects=True,
+            ).url
+            match = _RE_SITE_ID.search(final_url)
         site_id = match.group(2) if match else None
         if not site_id:
             raise AuthError(f"Could not extract site/battery id from URL: {final_url}")
@@ -244,7 +463,7 @@ class EnphaseClient:
             "https://enlighten.enphaseenergy.com/app-api/"
             f"{site_id}/data.json?app=1&device_status=non_retired&is_mobile=0"
         )
-        app_data = SESSION.get(app_url, timeout=30).json()
+        app_data = _response_json(SESSION.get(app_url, timeout=30))
         app_block = app_data.get("app", {})
         user_id = (
             app_block.get("userId")
@@ -257,8 +476,10 @@ class EnphaseClient:
 
         if not self.battery_id:
             self.battery_id = str(site_id)
+            self._cache_dirty = True
         if not self.user_id:
             self.user_id = str(user_id)
+            self._cache_dirty = True
 
         _LOGGER.info(
             "[Enphase] Discovered IDs (user_id=%s, battery_id=%s)",
@@ -271,29 +492,12 @@ class EnphaseClient:
     # -------------------------------------------------------------------------
 
     def battery_settings(self):
-        """Fetch current battery configuration."""
-        jwt, xsrf = self._ensure_tokens()
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"batterySettings/{self.battery_id}?userId={self.user_id}&source=enho"
-        )
-        headers = {
-            "content-type": "application/json",
-            "e-auth-token": jwt,
-            "x-xsrf-token": xsrf,
-            "username": str(self.user_id),
-            "cookie": f"BP-XSRF-Token={xsrf}",
-        }
-        r = SESSION.get(url, headers=headers, timeout=30)
-        if r.status_code == 403:
-            _LOGGER.warning("[Enphase] 403 Forbidden on battery_settings – refreshing XSRF.")
-            jwt, xsrf = self._ensure_tokens(force_refresh=True)
-            headers["e-auth-token"] = jwt
-            headers["x-xsrf-token"] = xsrf
-            r = SESSION.get(url, headers=headers, timeout=30)
+        """Fetch current battery configuration (inner ``data`` block)."""
+        url = self._api_urls()[0]
+        r = self._request("get", url, "battery_settings", base=_JSON_HEADERS)
         r.raise_for_status()
         _LOGGER.debug("[Enphase] Battery settings fetched.")
-        return r.json()
+        return _unwrap_data(_response_json(r))
 
     # -------------------------------------------------------------------------
     # ACTIONS (toggles)
@@ -305,25 +509,13 @@ class EnphaseClient:
 
         Accepts either short names (cfg/dtg/rbd) or full keys (cfgControl/dtgControl/rbdControl).
         """
-        valid_modes = ["cfg", "dtg", "rbd", "cfgControl", "dtgControl", "rbdControl"]
-        if mode not in valid_modes:
+        if mode not in _VALID_MODES:
             raise ValueError(f"Invalid mode: {mode}")
 
         # Normalise key
         short_mode = mode.replace("Control", "")
         _LOGGER.info("[Enphase] Setting mode '%s' -> %s", short_mode, enable)
 
-        jwt, xsrf = self._ensure_tokens()
-        headers = {
-            "content-type": "application/json",
-            "e-auth-token": jwt,
-            "x-xsrf-token": xsrf,
-            "username": str(self.user_id),
-            "origin": "https://battery-profile-ui.enphaseenergy.com",
-            "referer": "https://battery-profile-ui.enphaseenergy.com/",
-            "cookie": f"BP-XSRF-Token={xsrf}",
-        }
-
         # Payload mapping for each mode type
         # CFG is NOT wrapped in cfgControl — sent at top level per original API
         if short_mode == "cfg":
@@ -345,35 +537,8 @@ class EnphaseClient:
         else:
             raise ValueError(f"Unsupported mode: {short_mode}")
 
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"batterySettings/{self.battery_id}?userId={self.user_id}&source=enho"
-        )
-
-        _LOGGER.debug(
-            "[Enphase] set_mode request: url=%s headers=%s payload=%s",
-            url,
-            {k: v for k, v in headers.items() if k != "e-auth-token"},
-            payload,
-        )
-        r = SESSION.put(url, json=payload, headers=headers, timeout=30)
-        _LOGGER.debug(
-            "[Enphase] set_mode response: status=%s body=%s",
-            r.status_code,
-            r.text,
-        )
-        if r.status_code == 403:
-            _LOGGER.warning("[Enphase] 403 Forbidden on set_mode(%s) – refreshing XSRF and retrying", short_mode)
-            jwt, xsrf = self._ensure_tokens(force_refresh=True)
-            headers["e-auth-token"] = jwt
-            headers["x-xsrf-token"] = xsrf
-            r = SESSION.put(url, json=payload, headers=headers, timeout=30)
-            _LOGGER.debug(
-                "[Enphase] set_mode retry response: status=%s body=%s",
-                r.status_code,
-                r.text,
-            )
-
+        url = self._api_urls()[0]
+        r = self._request("put", url, f"set_mode({short_mode})", json=payload)
         if not r.ok:
             _LOGGER.error("[Enphase] set_mode(%s) failed: %s %s", short_mode, r.status_code, r.text)
             r.raise_for_status()
@@ -386,30 +551,11 @@ class EnphaseClient:
     # -------------------------------------------------------------------------
 
     def get_schedules(self):
-        """Return all schedules for this site/battery."""
-        jwt, xsrf = self._ensure_tokens()
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"battery/sites/{self.battery_id}/schedules"
-        )
-        headers = {
-            "content-type": "application/json",
-            "e-auth-token": jwt,
-            "x-xsrf-token": xsrf,
-            "username": str(self.user_id),
-            "origin": "https://battery-profile-ui.enphaseenergy.com",
-            "referer": "https://battery-profile-ui.enphaseenergy.com/",
-            "cookie": f"BP-XSRF-Token={xsrf}",
-        }
-        r = SESSION.get(url, headers=headers, timeout=30)
-        if r.status_code == 403:
-            _LOGGER.warning("[Enphase] 403 on get_schedules – refreshing tokens.")
-            jwt, xsrf = self._ensure_tokens(force_refresh=True)
-            headers["e-auth-token"] = jwt
-            headers["x-xsrf-token"] = xsrf
-            r = SESSION.get(url, headers=headers, timeout=30)
+        """Return all schedules for this site/battery (inner ``data`` block)."""
+        url = self._api_urls()[1]
+        r = self._request("get", url, "get_schedules")
         r.raise_for_status()
-        return r.json()
+        return _unwrap_data(_response_json(r))
 
     def add_schedule(
         self,
@@ -422,20 +568,7 @@ class EnphaseClient:
     ):
         """Add a new schedule entry (mirrors your REST command)."""
         schedule_type = str(schedule_type).upper()
-        jwt, xsrf = self._ensure_tokens()
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"battery/sites/{self.battery_id}/schedules"
-        )
-        headers = {
-            "content-type": "application/json",
-            "e-auth-token": jwt,
-            "x-xsrf-token": xsrf,
-            "username": str(self.user_id),
-            "origin": "https://battery-profile-ui.enphaseenergy.com",
-            "referer": "https://battery-profile-ui.enphaseenergy.com/",
-            "cookie": f"BP-XSRF-Token={xsrf}",
-        }
+        url = self._api_urls()[1]
         payload = {
             "timezone": timezone or "UTC",
             "startTime": start_time[:5],
@@ -445,28 +578,7 @@ class EnphaseClient:
             "days": [int(d) for d in days],
         }
         _LOGGER.info("[Enphase] Adding schedule: %s", payload)
-        _LOGGER.debug(
-            "[Enphase] add_schedule request: url=%s headers=%s payload=%s",
-            url,
-            {k: v for k, v in headers.items() if k != "e-auth-token"},
-            payload,
-        )
-        r = SESSION.post(url, json=payload, headers=headers, timeout=30)
-        _LOGGER.debug(
-            "[Enphase] add_schedule response: status=%s body=%s",
-            r.status_code,
-            r.text,
-        )
-        if r.status_code == 403:
-            jwt, xsrf = self._ensure_tokens(force_refresh=True)
-            headers["e-auth-token"] = jwt
-            headers["x-xsrf-token"] = xsrf
-            r = SESSION.post(url, json=payload, headers=headers, timeout=30)
-            _LOGGER.debug(
-                "[Enphase] add_schedule retry response: status=%s body=%s",
-                r.status_code,
-                r.text,
-            )
+        r = self._request("post", url, "add_schedule", json=payload)
         if not r.ok:
             _LOGGER.error(
                 "[Enphase] add_schedule(%s) failed: %s %s",
@@ -474,101 +586,181 @@ class EnphaseClient:
             )
             r.raise_for_status()
         _LOGGER.info("[Enphase] Schedule added successfully.")
-        return r.json()
+        return _response_json(r)
 
     def delete_schedule(self, schedule_id):
         """Delete a schedule by ID (mirrors your REST command)."""
-        jwt, xsrf = self._ensure_tokens()
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"battery/sites/{self.battery_id}/schedules/{schedule_id}/delete"
-        )
-        headers = {
-            "accept": "application/json, text/plain, */*",
-            "accept-language": "en-GB,en-US;q=0.9,en;q=0.8",
-            "content-type": "application/json",
-            "e-auth-token": jwt,
-            "x-xsrf-token": xsrf,
-            "username": str(self.user_id),
-            "origin": "https://battery-profile-ui.enphaseenergy.com",
-            "referer": "https://battery-profile-ui.enphaseenergy.com/",
-            "cookie": f"locale=en; BP-XSRF-Token={xsrf};",
-            "user-agent": "curl/8.14.1",
-        }
+        url = f"{self._api_urls()[1]}/{schedule_id}/delete"
         _LOGGER.info("[Enphase] Deleting schedule ID %s", schedule_id)
-        _LOGGER.debug(
-            "[Enphase] delete_schedule request: url=%s headers=%s",
+        r = self._request(
+            "post",
             url,
-            {k: v for k, v in headers.items() if k != "e-auth-token"},
+            "delete_schedule",
+            base=_DELETE_HEADERS,
+            cookie="locale=en; BP-XSRF-Token={xsrf};",
+            json={},
         )
-        r = SESSION.post(url, json={}, headers=headers, timeout=30)
-        _LOGGER.debug(
-            "[Enphase] delete_schedule response: status=%s body=%s",
-            r.status_code,
-            r.text,
-        )
-        if r.status_code == 403:
-            jwt, xsrf = self._ensure_tokens(force_refresh=True)
-            headers["e-auth-token"] = jwt
-            headers["x-xsrf-token"] = xsrf
-            r = SESSION.post(url, json={}, headers=headers, timeout=30)
-            _LOGGER.debug(
-                "[Enphase] delete_schedule retry response: status=%s body=%s",
-                r.status_code,
-                r.text,
-            )
         r.raise_for_status()
         _LOGGER.info("[Enphase] Schedule %s deleted successfully.", schedule_id)
         return True
 
+    def add_schedules_bulk(self, schedules: list[dict[str, Any]]) -> list[Any]:
+        """Add several schedules concurrently.
+
+        Each item holds the keyword arguments of :meth:`add_schedule`. Results
+        are returned in input order; a failed add yields its exception.
+        """
+        return self._run_bulk(self.add_schedule, schedules)
+
+    def delete_schedules_bulk(self, schedule_ids: list[Any]) -> list[Any]:
+        """Delete several schedules concurrently.
+
+        Results are returned in input order; a failed delete yields its exception.
+        """
+        return self._run_bulk(
+            self.delete_schedule, [{"schedule_id": sid} for sid in schedule_ids]
+        )
+
     def validate_schedule(self, schedule_type="dtg", force_opted=False):
         """Validate schedule feasibility (isValid endpoint)."""
         schedule_type = str(schedule_type).upper()
-        jwt, xsrf = self._ensure_tokens()
-        url = (
-            f"https://enlighten.enphaseenergy.com/service/batteryConfig/api/v1/"
-            f"battery/sites/{self.battery_id}/schedules/isValid"
-        )
+        url = self._api_urls()[2]
         payload = {"scheduleType": schedule_type}
         if schedule_type == "CFG" and force_opted:
             payload["forceScheduleOpted"] = True
-        headers = {
-            "content-type": "application/json",
-            "e-auth-token": jwt,
-            "x-xsrf-token": xsrf,
-            "username": str(self.user_id),
-            "origin": "https://battery-profile-ui.enphaseenergy.com",
-            "referer": "https://battery-profile-ui.enphaseenergy.com/",
-            "cookie": f"BP-XSRF-Token={xsrf}",
-        }
-        _LOGGER.debug(
-            "[Enphase] validate_schedule request: url=%s headers=%s payload=%s",
-            url,
-            {k: v for k, v in headers.items() if k != "e-auth-token"},
-            payload,
-        )
-        r = SESSION.post(url, json=payload, headers=headers, timeout=30)
-        _LOGGER.debug(
-            "[Enphase] validate_schedule response: status=%s body=%s",
-            r.status_code,
-            r.text,
-        )
+        r = self._request("post", url, "validate_schedule", json=payload)
         r.raise_for_status()
-        return r.json()
+        return _response_json(r)
+
+    # -------------------------------------------------------------------------
+    # REQUESTS
+    # -------------------------------------------------------------------------
+
+    def _run_bulk(
+        self, func: Callable[..., Any], calls: list[dict[str, Any]]
+    ) -> list[Any]:
+        """Run *func* once per kwargs dict on a small thread pool."""
+        if not calls:
+            return []
+        # Authenticate up front so the workers don't all race to refresh.
+        self._ensure_tokens()
+        with ThreadPoolExecutor(
+            max_workers=min(BULK_MAX_WORKERS, len(calls))
+        ) as pool:
+            futures = [pool.submit(func, **kwargs) for kwargs in calls]
+        return [f.exception() or f.result() for f in futures]
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        label: str,
+        base: dict[str, str] = _BP_UI_HEADERS,
+        cookie: str = "BP-XSRF-Token={xsrf}",
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send an authenticated request, refreshing tokens once on 401/403.
+
+        *cookie* is a template for the ``cookie`` header, formatted with the
+        current XSRF token on every attempt.
+        """
+        send = getattr(SESSION, method)
+        payload = kwargs.get("json")
+        if orjson is not None and payload is not None:
+            # Every header set already declares application/json.
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
+        # Redacting headers and decoding the body are only worth it when
+        # the debug lines will actually be emitted.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        jwt, xsrf = self._ensure_tokens()
+        for attempt in ("request", "retry"):
+            headers = self._auth_headers(jwt, xsrf, base)
+            headers["cookie"] = cookie.format(xsrf=xsrf)
+            if debug:
+                _LOGGER.debug(
+                    "[Enphase] %s %s: url=%s headers=%s payload=%s",
+                    label,
+                    attempt,
+                    url,
+                    {k: v for k, v in headers.items() if k != "e-auth-token"},
+                    payload,
+                )
+            response = send(url, headers=headers, timeout=30, **kwargs)
+            if debug:
+                _LOGGER.debug(
+                    "[Enphase] %s %s response: status=%s encoding=%s body=%s",
+                    label,
+                    attempt,
+                    response.status_code,
+                    response.headers.get("Content-Encoding"),
+                    response.text,
+                )
+            if response.status_code not in _AUTH_REJECTED:
+                break
+            if attempt == "request":
+                _LOGGER.warning(
+                    "[Enphase] HTTP %s on %s – refreshing tokens and retrying.",
+                    response.status_code,
+                    label,
+                )
+                # Another thread may already have refreshed the tokens
+                # after this request was sent; only log in again if not.
+                stale = (jwt, xsrf) == (self.jwt_token, self.xsrf_token)
+                self._tokens_ok_until = 0.0
+                jwt, xsrf = self._ensure_tokens(force_refresh=stale)
+        return response
 
     # -------------------------------------------------------------------------
     # UTILS
     # -------------------------------------------------------------------------
 
+    def _api_urls(self) -> tuple[str, str, str]:
+        """Return the battery settings, schedules and isValid URLs for this site.
+
+        The strings are rebuilt only when the IDs change; missing IDs are
+        discovered through the normal auth path first.
+        """
+        if not self.battery_id or not self.user_id:
+            self._ensure_tokens()
+        key = (self.battery_id, self.user_id)
+        cached = self._url_cache
+        if cached is None or cached[0] != key:
+            schedules = f"{_API_BASE}/battery/sites/{self.battery_id}/schedules"
+            cached = (
+                key,
+                (
+                    f"{_API_BASE}/batterySettings/{self.battery_id}"
+                    f"?userId={self.user_id}&source=enho",
+                    schedules,
+                    f"{schedules}/isValid",
+                ),
+            )
+            self._url_cache = cached
+        return cached[1]
+
+    def _auth_headers(
+        self, jwt: str | None, xsrf: str | None, base: dict[str, str] = _BP_UI_HEADERS
+    ) -> dict[str, str]:
+        """Return request headers: static *base* plus the current auth values."""
+        return {
+            **base,
+            "e-auth-token": jwt,
+            "x-xsrf-token": xsrf,
+            "username": self._username,
+            "cookie": f"BP-XSRF-Token={xsrf}",
+        }
+
     def _now_iso(self):
         """Return current UTC time in ISO format (milliseconds precision)."""
-        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        now = time.time()
+        ms = int((now % 1) * 1000)
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{ms:03d}Z"
 
     def _time_to_minutes(self, time_value: str | int) -> int:
         """Convert HH:MM strings into minutes since midnight."""
         if isinstance(time_value, int):
             return time_value
-        match = re.match(r"^(\d{1,2}):(\d{2})$", str(time_value).strip())
+        match = _RE_HHMM.match(str(time_value).strip())
         if not match:
             raise ValueError(f"Invalid time value: {time_value}")
         hours = int(match.group(1))
@@ -5,7 +5,7 @@ from __future__ import annotations
 from homeassistant.components.number import NumberEntity
 
 from .device import battery_device_info, schedule_editor_device_info
-from .editor import get_entry_data
+from .editor import EditorStateMixin
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -20,7 +20,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     )
 
 
-class EnphaseScheduleLimit(NumberEntity):
+class EnphaseScheduleLimit(EditorStateMixin, NumberEntity):
     """Number entity for schedule limit."""
 
     _attr_native_min_value = 0
@@ -31,27 +31,21 @@ class EnphaseScheduleLimit(NumberEntity):
     def __init__(self, entry_id: str, is_new: bool):
         self.entry_id = entry_id
         self.is_new = is_new
+        self._editor_key = "new_editor" if is_new else "editor"
         schedule_label = "New Schedule" if is_new else "Schedule"
         self._attr_name = f"Enphase {schedule_label} Limit"
         suffix = "new" if is_new else "edit"
         self._attr_unique_id = f"{entry_id}_{suffix}_limit"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
 
     @property
     def native_value(self) -> float | None:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        return float(entry_data[editor_key].get("limit", 0))
+        return float(self._editor.get("limit", 0))
 
     async def async_set_native_value(self, value: float) -> None:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        entry_data[editor_key]["limit"] = int(value)
+        self._editor["limit"] = int(value)
         self.async_write_ha_state()
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
-
 
 class EnphaseTimedDuration(NumberEntity):
     """Number entity for timed mode duration in minutes."""
@@ -67,6 +61,7 @@ class EnphaseTimedDuration(NumberEntity):
     def __init__(self, entry_id: str):
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_timed_duration"
+        self._attr_device_info = battery_device_info(entry_id)
         self._duration = 60  # default 60 minutes
 
     @property
@@ -76,7 +71,3 @@ class EnphaseTimedDuration(NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         self._duration = int(value)
         self.async_write_ha_state()
-
-    @property
-    def device_info(self):
-        return battery_device_info(self.entry_id)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -8,17 +10,61 @@ from homeassistant.helpers import selector
 
 from .const import DEFAULT_POLL_INTERVAL, DOMAIN
 from .const import LOGGER as _LOGGER
+from .editor import collect_schedules
 
 SERVICE_ADD_SCHEDULE = "add_schedule"
 SERVICE_DELETE_SCHEDULE = "delete_schedule"
 
 
+_SCHEDULE_TYPE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="cfg", label="Charge from Grid (CFG)"),
+            selector.SelectOptionDict(value="dtg", label="Discharge to Grid (DTG)"),
+            selector.SelectOptionDict(value="rbd", label="Restrict Battery Discharge (RBD)"),
+        ]
+    )
+)
+_TIME_SELECTOR = selector.TimeSelector()
+_LIMIT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=100, step=1, unit_of_measurement="%", mode="box")
+)
+_DAYS_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        multiple=True,
+        options=[
+            selector.SelectOptionDict(value="1", label="Monday"),
+            selector.SelectOptionDict(value="2", label="Tuesday"),
+            selector.SelectOptionDict(value="3", label="Wednesday"),
+            selector.SelectOptionDict(value="4", label="Thursday"),
+            selector.SelectOptionDict(value="5", label="Friday"),
+            selector.SelectOptionDict(value="6", label="Saturday"),
+            selector.SelectOptionDict(value="7", label="Sunday"),
+        ],
+    )
+)
+_CONFIRM_SELECTOR = selector.BooleanSelector()
+
+_SCHEDULE_ADD_SCHEMA = vol.Schema(
+    {
+        vol.Required("schedule_type"): _SCHEDULE_TYPE_SELECTOR,
+        vol.Required("start_time"): _TIME_SELECTOR,
+        vol.Required("end_time"): _TIME_SELECTOR,
+        vol.Required("limit", default=80): _LIMIT_SELECTOR,
+        vol.Required("days"): _DAYS_SELECTOR,
+    }
+)
+
+
 class EnphaseOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options for Enphase Envoy Cloud Control."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry):
         self._config_entry = config_entry
         self._last_error: str | None = None
+        # (coordinator.data, options) from the last build; the coordinator
+        # swaps in a new data dict on every refresh, so identity is enough.
+        self._schedule_options_cache: tuple[Any, list[selector.SelectOptionDict]] | None = None
 
     async def async_step_init(self, user_input=None):
         """Manage the Enphase options."""
@@ -96,51 +142,13 @@ class EnphaseOptionsFlowHandler(config_entries.OptionsFlow):
                         title="", data=dict(self._config_entry.options)
                     )
 
-        schedule_type_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(value="cfg", label="Charge from Grid (CFG)"),
-                    selector.SelectOptionDict(value="dtg", label="Discharge to Grid (DTG)"),
-                    selector.SelectOptionDict(value="rbd", label="Restrict Battery Discharge (RBD)"),
-                ]
-            )
-        )
-        time_selector = selector.TimeSelector()
-        limit_selector = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=0, max=100, step=1, unit_of_measurement="%", mode="box")
-        )
-        days_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                multiple=True,
-                options=[
-                    selector.SelectOptionDict(value="1", label="Monday"),
-                    selector.SelectOptionDict(value="2", label="Tuesday"),
-                    selector.SelectOptionDict(value="3", label="Wednesday"),
-                    selector.SelectOptionDict(value="4", label="Thursday"),
-                    selector.SelectOptionDict(value="5", label="Friday"),
-                    selector.SelectOptionDict(value="6", label="Saturday"),
-                    selector.SelectOptionDict(value="7", label="Sunday"),
-                ],
-            )
-        )
-
-        schema = vol.Schema(
-            {
-                vol.Required("schedule_type"): schedule_type_selector,
-                vol.Required("start_time"): time_selector,
-                vol.Required("end_time"): time_selector,
-                vol.Required("limit", default=80): limit_selector,
-                vol.Required("days"): days_selector,
-            }
-        )
-
         description_placeholders = {}
         if self._last_error:
             description_placeholders["error"] = self._last_error
 
         return self.async_show_form(
             step_id="schedule_add",
-            data_schema=schema,
+            data_schema=_SCHEDULE_ADD_SCHEMA,
             errors=errors,
             description_placeholders=description_placeholders,
         )
@@ -196,12 +204,11 @@ class EnphaseOptionsFlowHandler(config_entries.OptionsFlow):
         schedule_selector = selector.SelectSelector(
             selector.SelectSelectorConfig(options=options, multiple=True)
         )
-        confirm_selector = selector.BooleanSelector()
 
         schema = vol.Schema(
             {
                 vol.Required("schedule_ids"): schedule_selector,
-                vol.Required("confirm", default=False): confirm_selector,
+                vol.Required("confirm", default=False): _CONFIRM_SELECTOR,
             }
         )
 
@@ -223,42 +230,24 @@ class EnphaseOptionsFlowHandler(config_entries.OptionsFlow):
         if not coordinator or not getattr(coordinator, "data", None):
             return []
 
+        cached = self._schedule_options_cache
+        if cached is not None and cached[0] is coordinator.data:
+            return cached[1]
+
         options: list[selector.SelectOptionDict] = []
         for mode in ("cfg", "dtg", "rbd"):
-            schedules = coordinator.data.get("data", {}).get(f"{mode}Control", {})
-            sched_list: list | None = None
-            if isinstance(schedules, dict):
-                maybe = schedules.get("schedules")
-                if isinstance(maybe, list):
-                    sched_list = maybe
-
-            if sched_list is None:
-                fallback = coordinator.data.get("schedules", {})
-                if isinstance(fallback, dict):
-                    candidate = fallback.get(mode)
-                    if isinstance(candidate, dict) and isinstance(
-                        candidate.get("details"), list
-                    ):
-                        sched_list = candidate["details"]
-                    elif isinstance(candidate, list):
-                        sched_list = candidate
-                    else:
-                        inner = fallback.get("data", {}).get(mode)
-                        if isinstance(inner, dict) and isinstance(
-                            inner.get("details"), list
-                        ):
-                            sched_list = inner["details"]
-                        elif isinstance(inner, list):
-                            sched_list = inner
-
-            if not isinstance(sched_list, list):
-                continue
-            for sched in sched_list:
+            mode_label = mode.upper()
+            for sched in collect_schedules(coordinator, mode):
                 schedule_id = sched.get("scheduleId")
                 if schedule_id is None:
                     continue
-                label = f"#{schedule_id} – {mode.upper()} {sched.get('startTime', '??')}–{sched.get('endTime', '??')}"
+                start = sched.get("startTime", "??")
+                end = sched.get("endTime", "??")
                 options.append(
-                    selector.SelectOptionDict(value=str(schedule_id), label=label)
+                    selector.SelectOptionDict(
+                        value=str(schedule_id),
+                        label=f"#{schedule_id} – {mode_label} {start}–{end}",
+                    )
                 )
+        self._schedule_options_cache = (coordinator.data, options)
         return options
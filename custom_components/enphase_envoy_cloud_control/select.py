@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.select import SelectEntity
+from homeassistant.core import callback
 
 from .device import battery_device_info, schedule_editor_device_info
 from .editor import (
@@ -40,11 +42,36 @@ class EnphaseScheduleSelect(SelectEntity):
         self.coordinator = coordinator
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_schedule_selected"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
+        self._schedules_cache: tuple[Any, Any, list[str], dict[str, dict[str, Any]]] | None = None
+        self._attr_options = self._schedules_by_id()[0]
+
+    async def async_added_to_hass(self) -> None:
+        """Track coordinator refreshes so the option list stays current."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the schedule options once per coordinator refresh."""
+        self._attr_options = self._schedules_by_id()[0]
+        self.async_write_ha_state()
 
-    @property
-    def options(self):
-        schedules = normalize_schedules(self.coordinator)
-        return [schedule["id"] for schedule in schedules]
+    def _schedules_by_id(self) -> tuple[list[str], dict[str, dict[str, Any]]]:
+        """Return schedule ids and an id lookup.
+
+        Rebuilt only when the coordinator data or the client's cached
+        schedules (filled by the background fetch) change.
+        """
+        data = self.coordinator.data
+        last = getattr(self.coordinator.client, "_last_schedules", None)
+        cached = self._schedules_cache
+        if cached is None or cached[0] is not data or cached[1] is not last:
+            by_id = {sched["id"]: sched for sched in normalize_schedules(self.coordinator)}
+            cached = self._schedules_cache = (data, last, list(by_id), by_id)
+        return cached[2], cached[3]
 
     @property
     def current_option(self):
@@ -53,8 +80,7 @@ class EnphaseScheduleSelect(SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         entry_data = get_entry_data(self.hass, self.entry_id)
-        schedules = normalize_schedules(self.coordinator)
-        match = next((sched for sched in schedules if sched["id"] == option), None)
+        match = self._schedules_by_id()[1].get(option)
         editor = entry_data["editor"]
         editor["selected_schedule_id"] = option
         if match:
@@ -65,10 +91,6 @@ class EnphaseScheduleSelect(SelectEntity):
             editor["days"] = editor_days_from_list(match.get("days", []))
         self.async_write_ha_state()
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
-
 
 class EnphaseNewScheduleTypeSelect(SelectEntity):
     """Select schedule type for a new schedule."""
@@ -79,6 +101,7 @@ class EnphaseNewScheduleTypeSelect(SelectEntity):
     def __init__(self, entry_id: str):
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_new_schedule_type"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
         self._attr_options = ["cfg", "dtg", "rbd"]
 
     @property
@@ -98,10 +121,6 @@ class EnphaseNewScheduleTypeSelect(SelectEntity):
         entry_data["new_editor"]["schedule_type"] = option
         self.async_write_ha_state()
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
-
 
 class EnphaseTimedModeSelect(SelectEntity):
     """Select which mode to use for timed mode."""
@@ -112,6 +131,7 @@ class EnphaseTimedModeSelect(SelectEntity):
     def __init__(self, entry_id: str):
         self.entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_timed_mode_select"
+        self._attr_device_info = battery_device_info(entry_id)
         self._attr_options = ["Charge from Grid", "Discharge to Grid", "Restrict Battery Discharge"]
         self._selected = "Restrict Battery Discharge"
 
@@ -123,7 +143,3 @@ class EnphaseTimedModeSelect(SelectEntity):
         if option in self._attr_options:
             self._selected = option
             self.async_write_ha_state()
-
-    @property
-    def device_info(self):
-        return battery_device_info(self.entry_id)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import logging
 from datetime import datetime, timezone
+from typing import Any
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 from .device import battery_device_info
@@ -11,6 +13,8 @@ _LOGGER = logging.getLogger(__name__)
 
 MODE_NAMES = {"cfg": "Charge from Grid", "dtg": "Discharge to Grid", "rbd": "Restrict Battery Discharge"}
 
+_CONTROL_KEYS = frozenset({"cfgControl", "dtgControl", "rbdControl"})
+
 _DAY_ABBR = {1: "Mon", 2: "Tue", 3: "Wed", 4: "Thu", 5: "Fri", 6: "Sat", 7: "Sun"}
 
 
@@ -31,6 +35,52 @@ def _format_days(days: list[int]) -> str:
     return ", ".join(_DAY_ABBR.get(d, str(d)) for d in days)
 
 
+def _refresh_timestamps(coordinator) -> dict[str, str]:
+    """Return the refresh/poll timestamp attributes, built once per coordinator update."""
+    attrs = {"last_refresh": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+    t = getattr(coordinator, "last_update_success_time", None)
+    if isinstance(t, datetime):
+        attrs["last_successful_poll"] = t.isoformat(timespec="seconds")
+    return attrs
+
+
+def _schedule_list(block: Any) -> list | None:
+    """Return the schedule list held by a mode block, or None if it has none."""
+    if isinstance(block, list):
+        return block
+    if isinstance(block, dict) and "details" in block:
+        return block["details"]
+    return None
+
+
+def _mode_schedules(root: Any, mode: str) -> list | None:
+    """Find a mode's schedules under root[mode] or root["data"][mode]."""
+    if not isinstance(root, dict):
+        return None
+    nested = root.get("data")
+    for block in (root.get(mode), nested.get(mode) if isinstance(nested, dict) else None):
+        if block:
+            found = _schedule_list(block)
+            if found is not None:
+                return found
+    return None
+
+
+def _format_schedule(sched: dict) -> str:
+    """Format one schedule as 'Mon-Fri 01:00-02:00 (80%)'."""
+    start = sched.get("startTime", "??")
+    end = sched.get("endTime", "??")
+    limit = sched.get("limit") or sched.get("powerLimit")
+    days = sched.get("days") or sched.get("daysOfWeek") or []
+    if isinstance(days, (list, tuple)):
+        days_str = _format_days([int(d) for d in days if str(d).isdigit()])
+    else:
+        days_str = ""
+    limit_str = f" ({int(limit)}%)" if limit is not None else ""
+    day_prefix = f"{days_str} " if days_str else ""
+    return f"{day_prefix}{start}-{end}{limit_str}"
+
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up Enphase sensors from a config entry."""
     coordinator = get_coordinator(hass, entry.entry_id)
@@ -60,16 +110,29 @@ class EnphaseBatteryModesSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_battery_modes"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
+        self._cached_attrs: dict | None = None
 
     @property
     def state(self):
         """Return basic status."""
         return "OK" if self.coordinator.data else "Unavailable"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the diagnostic attributes once per coordinator refresh."""
+        self._cached_attrs = self._compute_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self):
         """Expose detailed diagnostic data and timing."""
+        if self._cached_attrs is None:
+            self._cached_attrs = self._compute_attrs()
+        return self._cached_attrs
+
+    def _compute_attrs(self) -> dict:
+        """Build the diagnostic attributes from the current coordinator data."""
         try:
             data = self.coordinator.data or {}
             d = data.get("data", {}) or {}
@@ -94,32 +157,14 @@ class EnphaseBatteryModesSensor(CoordinatorEntity, SensorEntity):
                 "cfg": d.get("cfgControl"),
                 "dtg": d.get("dtgControl"),
                 "rbd": d.get("rbdControl"),
-                "other": {
-                    k: v
-                    for k, v in d.items()
-                    if k not in ("cfgControl", "dtgControl", "rbdControl")
-                },
-                "last_refresh": datetime.now(timezone.utc).strftime(
-                    "%Y-%m-%dT%H:%M:%S%z"
-                ),
+                "other": {k: d[k] for k in d.keys() - _CONTROL_KEYS},
+                **_refresh_timestamps(self.coordinator),
             }
-
-            # Include last successful poll timestamp from coordinator
-            if getattr(self.coordinator, "last_update_success_time", None):
-                t = self.coordinator.last_update_success_time
-                if isinstance(t, datetime):
-                    attrs["last_successful_poll"] = t.strftime("%Y-%m-%dT%H:%M:%S%z")
-
             return attrs
         except Exception as exc:
             _LOGGER.warning("Error parsing battery modes attributes: %s", exc)
             return {"error": str(exc)}
 
-    @property
-    def device_info(self):
-        """Ensure the sensor is attached to the shared Enphase device."""
-        return battery_device_info(self.coordinator.entry.entry_id)
-
 
 class EnphaseSchedulesSummarySensor(CoordinatorEntity, SensorEntity):
     """Normalized schedule list for editor usage."""
@@ -131,27 +176,22 @@ class EnphaseSchedulesSummarySensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_schedules_summary"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
+        self._update_from_data()
 
-    @property
-    def state(self):
-        schedules = normalize_schedules(self.coordinator)
-        return str(len(schedules))
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recount the schedules and rebuild the attributes once per refresh."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
-    @property
-    def extra_state_attributes(self):
-        attrs = {
-            "schedules": normalize_schedules(self.coordinator),
-            "last_refresh": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z"),
+    def _update_from_data(self) -> None:
+        schedules = normalize_schedules(self.coordinator)
+        self._attr_native_value = str(len(schedules))
+        self._attr_extra_state_attributes = {
+            "schedules": schedules,
+            **_refresh_timestamps(self.coordinator),
         }
-        if getattr(self.coordinator, "last_update_success_time", None):
-            t = self.coordinator.last_update_success_time
-            if isinstance(t, datetime):
-                attrs["last_successful_poll"] = t.strftime("%Y-%m-%dT%H:%M:%S%z")
-        return attrs
-
-    @property
-    def device_info(self):
-        return battery_device_info(self.coordinator.entry.entry_id)
 
 
 
@@ -169,69 +209,50 @@ class EnphaseScheduleSensor(CoordinatorEntity, SensorEntity):
         self.mode = mode  # cfg | dtg | rbd
         self._attr_name = f"{MODE_NAMES.get(mode, mode.upper())} Schedule"
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{mode}_schedule"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
+        self._schedules_cache: tuple[Any, Any, list, list[str], str] | None = None
 
     @property
     def state(self):
         """Human-readable schedule summary."""
-        scheds = self._schedules()
-        if not scheds:
-            return "No schedules"
-        parts = []
-        for sched in scheds:
-            start = sched.get("startTime", "??")
-            end = sched.get("endTime", "??")
-            limit = sched.get("limit") or sched.get("powerLimit")
-            days = sched.get("days") or sched.get("daysOfWeek") or []
-            if isinstance(days, (list, tuple)):
-                days_str = _format_days([int(d) for d in days if str(d).isdigit()])
-            else:
-                days_str = ""
-            limit_str = f" ({int(limit)}%)" if limit is not None else ""
-            day_prefix = f"{days_str} " if days_str else ""
-            parts.append(f"{day_prefix}{start}-{end}{limit_str}")
-        return ", ".join(parts)
+        return self._resolved()[2]
 
     @property
     def extra_state_attributes(self):
         """Expose individual schedules as numbered attributes."""
-        scheds = self._schedules()
+        scheds, labels, _ = self._resolved()
         attrs = {}
-        for i, sched in enumerate(scheds, 1):
-            start = sched.get("startTime", "??")
-            end = sched.get("endTime", "??")
-            limit = sched.get("limit") or sched.get("powerLimit")
-            days = sched.get("days") or sched.get("daysOfWeek") or []
-            if isinstance(days, (list, tuple)):
-                days_str = _format_days([int(d) for d in days if str(d).isdigit()])
-            else:
-                days_str = ""
-            limit_str = f" ({int(limit)}%)" if limit is not None else ""
-            day_prefix = f"{days_str} " if days_str else ""
-            attrs[f"schedule_{i}"] = f"{day_prefix}{start}-{end}{limit_str}"
+        for i, (sched, label) in enumerate(zip(scheds, labels), 1):
+            attrs[f"schedule_{i}"] = label
             schedule_id = sched.get("scheduleId")
             if schedule_id:
                 attrs[f"schedule_{i}_id"] = str(schedule_id)
         attrs["schedule_count"] = len(scheds)
         return attrs
 
-    # ---------------------------------------------------------------------
-    # Async-safe schedule fetching with caching
-    # ---------------------------------------------------------------------
-    async def _async_fetch_schedules_safe(self):
-        """Fetch schedules via executor to avoid blocking."""
-        try:
-            schedules = await self.coordinator.hass.async_add_executor_job(
-                self.coordinator.client.get_schedules
-            )
-            # Cache for reuse across sensors
-            self.coordinator.client._last_schedules = schedules
-            return schedules
-        except Exception as e:
-            _LOGGER.warning("Async fetch failed for %s schedules: %s", self.mode, e)
-            return {}
+    def _resolved(self) -> tuple[list, list[str], str]:
+        """Return schedules, their labels and the state string for the current data.
+
+        Everything is derived once per coordinator update and reused by the
+        state and attribute reads until the data object or the client's
+        cached schedules (filled by the background fetch) change.
+        """
+        data = self.coordinator.data
+        last = getattr(self.coordinator.client, "_last_schedules", None)
+        cached = self._schedules_cache
+        if cached is None or cached[0] is not data or cached[1] is not last:
+            scheds = self._extract_schedules()
+            labels = [_format_schedule(sched) for sched in scheds]
+            state = ", ".join(labels) if labels else "No schedules"
+            cached = self._schedules_cache = (data, last, scheds, labels, state)
+        return cached[2:]
 
     def _schedules(self):
         """Return current schedules for this mode."""
+        return self._resolved()[0]
+
+    def _extract_schedules(self):
+        """Walk the known payload layouts for this mode's schedule list."""
         try:
             data_root = self.coordinator.data or {}
             d = data_root.get("data", {})
@@ -247,55 +268,25 @@ class EnphaseScheduleSensor(CoordinatorEntity, SensorEntity):
                 return block2["details"]
 
             # Case 3: coordinator exposes schedules at the root level
-            sched_root = data_root.get("schedules")
-            if isinstance(sched_root, dict):
-                candidates = []
-                if self.mode in sched_root:
-                    candidates.append(sched_root[self.mode])
-                if "data" in sched_root and isinstance(sched_root["data"], dict):
-                    candidates.append(sched_root["data"].get(self.mode))
-
-                for candidate in candidates:
-                    if not candidate:
-                        continue
-                    if isinstance(candidate, dict) and "details" in candidate:
-                        return candidate["details"]
-                    if isinstance(candidate, list):
-                        return candidate
+            found = _mode_schedules(data_root.get("schedules"), self.mode)
+            if found is not None:
+                return found
 
             # Case 4: fallback — use cached schedules
             if hasattr(self.coordinator.client, "_last_schedules"):
                 schedules = getattr(self.coordinator.client, "_last_schedules")
-            elif data_root.get("schedules_raw"):
-                schedules = data_root.get("schedules_raw")
             else:
-                # Schedule a background safe fetch
-                self.coordinator.hass.async_create_task(self._async_fetch_schedules_safe())
+                # Schedule a background fetch, shared by all schedule sensors
+                self.coordinator.hass.async_create_task(
+                    self.coordinator.async_ensure_schedules_loaded()
+                )
                 return []
 
-            if isinstance(schedules, dict):
-                if self.mode in schedules:
-                    m = schedules[self.mode]
-                    if isinstance(m, dict) and "details" in m:
-                        return m["details"]
-                    if isinstance(m, list):
-                        return m
-                if "data" in schedules and isinstance(schedules["data"], dict):
-                    m = schedules["data"].get(self.mode)
-                    if isinstance(m, dict) and "details" in m:
-                        return m["details"]
-                    if isinstance(m, list):
-                        return m
-            return []
+            return _mode_schedules(schedules, self.mode) or []
         except Exception as e:
             _LOGGER.warning("Failed to extract %s schedules: %s", self.mode, e)
             return []
 
-    @property
-    def device_info(self):
-        """Ensure this sensor attaches to the same device as toggles."""
-        return battery_device_info(self.coordinator.entry.entry_id)
-
 
 class EnphaseTimedModeActiveSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing the currently active timed mode and remaining time."""
@@ -306,6 +297,7 @@ class EnphaseTimedModeActiveSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_timed_mode_active"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
 
     @property
     def state(self):
@@ -332,7 +324,3 @@ class EnphaseTimedModeActiveSensor(CoordinatorEntity, SensorEntity):
             "expires_at": active["expires_at"],
             "schedule_id": active.get("schedule_id"),
         }
-
-    @property
-    def device_info(self):
-        return battery_device_info(self.coordinator.entry.entry_id)
@@ -1,10 +1,10 @@
 from __future__ import annotations
-import asyncio
 import logging
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .device import battery_device_info, schedule_editor_device_info
-from .editor import DAY_ORDER, get_coordinator, get_entry_data
+from .editor import DAY_ORDER, EditorStateMixin, get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,19 +12,16 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = get_coordinator(hass, entry.entry_id)
     data = coordinator.data.get("data", {}) if coordinator.data else {}
-    switches = []
-
-    for key in ["cfgControl", "dtgControl", "rbdControl"]:
-        if key in data:
-            switches.append(EnphaseModeSwitch(coordinator, key))
-
-    for key, _ in DAY_ORDER:
-        switches.append(
-            EnphaseEditorDaySwitch(entry.entry_id, key, is_new=False)
-        )
-        switches.append(
-            EnphaseEditorDaySwitch(entry.entry_id, key, is_new=True)
-        )
+    switches = [
+        EnphaseModeSwitch(coordinator, key)
+        for key in ("cfgControl", "dtgControl", "rbdControl")
+        if key in data
+    ]
+    switches.extend(
+        EnphaseEditorDaySwitch(entry.entry_id, key, is_new=is_new)
+        for key, _ in DAY_ORDER
+        for is_new in (False, True)
+    )
 
     async_add_entities(switches, True)
 
@@ -39,6 +36,7 @@ class EnphaseModeSwitch(CoordinatorEntity, SwitchEntity):
         mode_names = {"cfg": "Charge from Grid", "dtg": "Discharge to Grid", "rbd": "Restrict Battery Discharge"}
         self._attr_name = mode_names.get(self.short_mode, f"Enphase {self.short_mode.upper()} Mode")
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{self.short_mode.lower()}"
+        self._attr_device_info = battery_device_info(coordinator.entry.entry_id)
 
     # ------------------------------------------------------------------
 
@@ -56,9 +54,8 @@ class EnphaseModeSwitch(CoordinatorEntity, SwitchEntity):
         await self.coordinator.hass.async_add_executor_job(
             self.coordinator.client.set_mode, self.key, True
         )
-        # Wait 5 s for cloud propagation, then force refresh
-        await asyncio.sleep(5)
-        await self.coordinator.async_force_refresh()
+        # Refresh once the cloud has propagated the change
+        await self.coordinator.async_request_settled_refresh()
 
     async def async_turn_off(self):
         """Disable the mode in Enphase Cloud."""
@@ -66,47 +63,35 @@ class EnphaseModeSwitch(CoordinatorEntity, SwitchEntity):
         await self.coordinator.hass.async_add_executor_job(
             self.coordinator.client.set_mode, self.key, False
         )
-        await asyncio.sleep(5)
-        await self.coordinator.async_force_refresh()
-
-    # ------------------------------------------------------------------
-
-    @property
-    def device_info(self):
-        """Attach to Enphase Envoy Cloud device."""
-        return battery_device_info(self.coordinator.entry.entry_id)
+        await self.coordinator.async_request_settled_refresh()
 
 
-class EnphaseEditorDaySwitch(SwitchEntity):
+class EnphaseEditorDaySwitch(EditorStateMixin, SwitchEntity):
     """Switch representing a weekday toggle for schedule editing."""
 
     def __init__(self, entry_id: str, day_key: str, is_new: bool):
         self.entry_id = entry_id
         self.day_key = day_key
         self.is_new = is_new
+        self._editor_key = "new_editor" if is_new else "editor"
         schedule_label = "New Schedule" if is_new else "Schedule"
         self._attr_name = f"Enphase {schedule_label} {day_key.title()}"
         suffix = "new" if is_new else "edit"
         self._attr_unique_id = f"{entry_id}_{suffix}_{day_key}"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
 
     @property
     def is_on(self) -> bool:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        return bool(entry_data[editor_key]["days"].get(self.day_key))
+        return bool(self._editor["days"].get(self.day_key))
 
     async def async_turn_on(self) -> None:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        entry_data[editor_key]["days"][self.day_key] = True
-        self.async_write_ha_state()
+        self._set_day(True)
 
     async def async_turn_off(self) -> None:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        entry_data[editor_key]["days"][self.day_key] = False
-        self.async_write_ha_state()
+        self._set_day(False)
 
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
+    @callback
+    def _set_day(self, enabled: bool) -> None:
+        """Toggle the weekday in the editor state; pure in-memory, no I/O."""
+        self._editor["days"][self.day_key] = enabled
+        self.async_write_ha_state()
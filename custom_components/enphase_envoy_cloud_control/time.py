@@ -7,7 +7,7 @@ from datetime import time
 from homeassistant.components.time import TimeEntity
 
 from .device import schedule_editor_device_info
-from .editor import get_entry_data
+from .editor import EditorStateMixin
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -32,34 +32,32 @@ def _parse_time(value: str | None) -> time | None:
         return None
 
 
-class EnphaseScheduleTime(TimeEntity):
+class EnphaseScheduleTime(EditorStateMixin, TimeEntity):
     """Time entity for schedule start/end."""
 
     def __init__(self, entry_id: str, key: str, is_new: bool):
         self.entry_id = entry_id
         self.key = key
         self.is_new = is_new
+        self._editor_key = "new_editor" if is_new else "editor"
+        self._parsed: tuple[str | None, time | None] = (None, None)
         schedule_label = "New Schedule" if is_new else "Schedule"
         label = "Start" if key == "start_time" else "End"
         self._attr_name = f"Enphase {schedule_label} {label}"
         suffix = "new" if is_new else "edit"
         self._attr_unique_id = f"{entry_id}_{suffix}_{key}"
+        self._attr_device_info = schedule_editor_device_info(entry_id)
 
     @property
     def native_value(self) -> time | None:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        value = entry_data[editor_key].get(self.key)
+        value = self._editor.get(self.key)
         if isinstance(value, time):
             return value
-        return _parse_time(value)
+        # The editor value only changes on user edits; reuse the last parse.
+        if value != self._parsed[0]:
+            self._parsed = (value, _parse_time(value))
+        return self._parsed[1]
 
     async def async_set_value(self, value: time) -> None:
-        entry_data = get_entry_data(self.hass, self.entry_id)
-        editor_key = "new_editor" if self.is_new else "editor"
-        entry_data[editor_key][self.key] = value.strftime("%H:%M")
+        self._editor[self.key] = value.strftime("%H:%M")
         self.async_write_ha_state()
-
-    @property
-    def device_info(self):
-        return schedule_editor_device_info(self.entry_id)
@@ -152,13 +152,7 @@ async def enable_timed_mode(
     }
 
     await _save_store(hass, entry_id)
-
-    # Refresh so entities pick up the mode change
-    async def _refresh_callback(_now) -> None:
-        """Refresh callback — runs in event loop."""
-        await coordinator.async_request_refresh()
-
-    async_call_later(hass, 5, _refresh_callback)
+    _schedule_refresh(hass, coordinator)
 
 
 async def _on_timed_mode_expired(
@@ -186,14 +180,21 @@ async def cancel_timed_mode(
         _LOGGER.debug("[Enphase] No active timed mode for %s, nothing to cancel.", mode)
         return
 
+    coordinator = get_coordinator(hass, entry_id)
+    await _release_timed_mode(hass, coordinator.client, mode, info, disable_mode)
+    await _save_store(hass, entry_id)
+    _schedule_refresh(hass, coordinator)
+
+
+async def _release_timed_mode(
+    hass: HomeAssistant, client, mode: str, info: dict, disable_mode: bool
+) -> None:
+    """Stop the timer, delete the temporary schedule and optionally disable the mode."""
     # Cancel the pending timer if it hasn't fired yet
     cancel_cb = info.get("cancel")
     if callable(cancel_cb):
         cancel_cb()
 
-    coordinator = get_coordinator(hass, entry_id)
-    client = coordinator.client
-
     # Delete the temporary schedule
     schedule_id = info.get("schedule_id")
     if schedule_id:
@@ -213,9 +214,9 @@ async def cancel_timed_mode(
         except Exception as exc:
             _LOGGER.error("[Enphase] Failed to disable %s: %s", mode, exc)
 
-    await _save_store(hass, entry_id)
 
-    # Refresh after delay
+def _schedule_refresh(hass: HomeAssistant, coordinator) -> None:
+    """Refresh after a delay so entities pick up the cloud-side change."""
     async def _refresh_callback(_now) -> None:
         await coordinator.async_request_refresh()
 
@@ -226,9 +227,22 @@ async def cancel_all_timed_modes(
     hass: HomeAssistant, entry_id: str, *, disable_modes: bool = True
 ) -> None:
     """Cancel all active timed modes for an entry (used on unload)."""
+    from .editor import get_coordinator
+
     timed = _timed_modes(hass, entry_id)
-    for mode in list(timed.keys()):
-        await cancel_timed_mode(hass, entry_id, mode, disable_mode=disable_modes)
+    active = list(timed.items())
+    timed.clear()
+    if active:
+        coordinator = get_coordinator(hass, entry_id)
+        # Modes are independent, so only their delete/disable round-trips
+        # overlap; the store is cleared and a refresh scheduled once below.
+        await asyncio.gather(
+            *(
+                _release_timed_mode(hass, coordinator.client, mode, info, disable_modes)
+                for mode, info in active
+            )
+        )
+        _schedule_refresh(hass, coordinator)
     await _clear_store(hass, entry_id)
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -77,23 +79,33 @@ SAMPLE_SCHEDULES_DATA = {
 SAMPLE_COORDINATOR_DATA = {
     "data": SAMPLE_BATTERY_DATA["data"],
     "schedules": SAMPLE_SCHEDULES_DATA["data"],
-    "schedules_raw": SAMPLE_SCHEDULES_DATA,
 }
 
 
+@pytest.fixture
+def battery_data():
+    """Private copy of the sample battery payload for tests that run it through _merge.
+
+    _merge rewrites each control block's schedule list in place, so passing
+    SAMPLE_BATTERY_DATA directly would leak merged schedules into other tests.
+    Read-only tests keep using the shared constant.
+    """
+    return copy.deepcopy(SAMPLE_BATTERY_DATA["data"])
+
+
 @pytest.fixture
 def mock_entry():
-    """Create a mock ConfigEntry."""
-    entry = MagicMock()
-    entry.entry_id = ENTRY_ID
-    entry.data = {
-        "email": "test@example.com",
-        "password": "secret",
-        "user_id": "12345",
-        "battery_id": "67890",
-    }
-    entry.options = {"poll_interval": 30}
-    return entry
+    """Create a stand-in ConfigEntry; only plain attributes are read, so no call tracking."""
+    return SimpleNamespace(
+        entry_id=ENTRY_ID,
+        data={
+            "email": "test@example.com",
+            "password": "secret",
+            "user_id": "12345",
+            "battery_id": "67890",
+        },
+        options={"poll_interval": 30},
+    )
 
 
 @pytest.fixture
@@ -106,8 +118,8 @@ def mock_client():
     client.battery_id = "67890"
     client.jwt_token = "fake.jwt.token"
     client.xsrf_token = "fake-xsrf"
-    client.battery_settings.return_value = SAMPLE_BATTERY_DATA
-    client.get_schedules.return_value = SAMPLE_SCHEDULES_DATA
+    client.battery_settings.return_value = SAMPLE_BATTERY_DATA["data"]
+    client.get_schedules.return_value = SAMPLE_SCHEDULES_DATA["data"]
     client.add_schedule.return_value = {"scheduleId": "new-sched-id"}
     client.delete_schedule.return_value = True
     client.set_mode.return_value = True
@@ -128,6 +140,7 @@ def mock_coordinator(mock_entry, mock_client):
     coordinator.hass.async_add_executor_job = AsyncMock(side_effect=lambda fn, *a, **kw: fn(*a, **kw))
     coordinator.async_request_refresh = AsyncMock()
     coordinator.async_force_refresh = AsyncMock()
+    coordinator.async_request_settled_refresh = AsyncMock()
     coordinator.last_update_success_time = None
     return coordinator
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from homeassistant.helpers import entity_registry as er
 
+from custom_components.enphase_envoy_cloud_control import timed_mode
 from custom_components.enphase_envoy_cloud_control.const import DOMAIN
 from custom_components.enphase_envoy_cloud_control.button import (
     EnphaseCancelTimedModeButton,
@@ -75,12 +77,6 @@ class TestScheduleSaveButton:
         assert data["schedule_id"] == "sched-123"
         assert data["confirm"] is True
 
-    @pytest.mark.asyncio
-    async def test_press_no_selection(self, button, editor_state):
-        editor_state["selected_schedule_id"] = None
-        await button.async_press()
-        button.hass.services.async_call.assert_not_awaited()
-
 
 # ---------------------------------------------------------------------------
 # EnphaseScheduleDeleteButton
@@ -104,11 +100,22 @@ class TestScheduleDeleteButton:
         assert data["schedule_id"] == "sched-456"
         assert data["confirm"] is True
 
-    @pytest.mark.asyncio
-    async def test_press_no_selection(self, button, editor_state):
-        editor_state["selected_schedule_id"] = None
-        await button.async_press()
-        button.hass.services.async_call.assert_not_awaited()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "button_cls",
+    [
+        pytest.param(EnphaseScheduleSaveButton, id="save"),
+        pytest.param(EnphaseScheduleDeleteButton, id="delete"),
+    ],
+)
+async def test_press_no_selection(button_cls, mock_hass, editor_state):
+    """Save and delete both need a selected schedule before calling a service."""
+    button = button_cls(ENTRY_ID)
+    button.hass = mock_hass
+    editor_state["selected_schedule_id"] = None
+    await button.async_press()
+    button.hass.services.async_call.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -149,55 +156,43 @@ class TestStartTimedModeButton:
         btn.hass = MagicMock()
         return btn
 
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        reg = MagicMock()
+        monkeypatch.setattr(er, "async_get", MagicMock(return_value=reg))
+        return reg
+
+    @pytest.fixture
+    def mock_enable(self, monkeypatch):
+        mock = AsyncMock()
+        monkeypatch.setattr(timed_mode, "enable_timed_mode", mock)
+        return mock
+
     @pytest.mark.asyncio
-    async def test_press_calls_enable(self, button):
-        # Mock entity registry and state
-        mock_reg = MagicMock()
-
-        def _get_entity_id(domain, integration, unique_id):
-            if domain == "select":
-                return "select.timed_mode"
-            return "number.timed_duration"
-
-        mock_reg.async_get_entity_id.side_effect = _get_entity_id
-        mode_state = MagicMock()
-        mode_state.state = "Charge from Grid"
-        dur_state = MagicMock()
-        dur_state.state = "90"
-
-        def _get_state(entity_id):
-            if entity_id == "select.timed_mode":
-                return mode_state
-            return dur_state
-
-        button.hass.states.get = MagicMock(side_effect=_get_state)
-
-        with patch("homeassistant.helpers.entity_registry.async_get", return_value=mock_reg):
-            with patch(
-                "custom_components.enphase_envoy_cloud_control.timed_mode.enable_timed_mode",
-                new_callable=AsyncMock,
-            ) as mock_enable:
-                await button.async_press()
-                mock_enable.assert_awaited_once()
-                args = mock_enable.call_args
-                assert args[0][2] == "cfg"  # mode
-                assert args[0][3] == 90  # duration
+    async def test_press_calls_enable(self, button, registry, mock_enable):
+        # async_press looks up the mode select first, then the duration number
+        registry.async_get_entity_id.side_effect = ["select.timed_mode", "number.timed_duration"]
+        states = {
+            "select.timed_mode": MagicMock(state="Charge from Grid"),
+            "number.timed_duration": MagicMock(state="90"),
+        }
+        button.hass.states.get = MagicMock(side_effect=states.get)
+
+        await button.async_press()
+        mock_enable.assert_awaited_once()
+        args = mock_enable.call_args
+        assert args[0][2] == "cfg"  # mode
+        assert args[0][3] == 90  # duration
 
     @pytest.mark.asyncio
-    async def test_defaults_when_no_state(self, button):
-        mock_reg = MagicMock()
-        mock_reg.async_get_entity_id.return_value = None
+    async def test_defaults_when_no_state(self, button, registry, mock_enable):
+        registry.async_get_entity_id.return_value = None
         button.hass.states.get = MagicMock(return_value=None)
 
-        with patch("homeassistant.helpers.entity_registry.async_get", return_value=mock_reg):
-            with patch(
-                "custom_components.enphase_envoy_cloud_control.timed_mode.enable_timed_mode",
-                new_callable=AsyncMock,
-            ) as mock_enable:
-                await button.async_press()
-                args = mock_enable.call_args
-                assert args[0][2] == "rbd"  # default mode
-                assert args[0][3] == 60  # default duration
+        await button.async_press()
+        args = mock_enable.call_args
+        assert args[0][2] == "rbd"  # default mode
+        assert args[0][3] == 60  # default duration
 
 
 # ---------------------------------------------------------------------------
@@ -210,32 +205,27 @@ class TestCancelTimedModeButton:
         btn.hass = MagicMock()
         return btn
 
+    @pytest.fixture
+    def cancel_mocks(self, monkeypatch):
+        mock_get = MagicMock(return_value=None)
+        mock_cancel = AsyncMock()
+        monkeypatch.setattr(timed_mode, "get_active_timed_mode", mock_get)
+        monkeypatch.setattr(timed_mode, "cancel_timed_mode", mock_cancel)
+        return mock_get, mock_cancel
+
     @pytest.mark.asyncio
-    async def test_cancels_active_mode(self, button):
-        active = {"mode": "cfg", "mode_name": "Charge from Grid", "remaining_minutes": 30}
-
-        with patch(
-            "custom_components.enphase_envoy_cloud_control.timed_mode.get_active_timed_mode",
-            return_value=active,
-        ):
-            with patch(
-                "custom_components.enphase_envoy_cloud_control.timed_mode.cancel_timed_mode",
-                new_callable=AsyncMock,
-            ) as mock_cancel:
-                await button.async_press()
-                mock_cancel.assert_awaited_once()
-                args = mock_cancel.call_args
-                assert args[0][2] == "cfg"
+    async def test_cancels_active_mode(self, button, cancel_mocks):
+        mock_get, mock_cancel = cancel_mocks
+        mock_get.return_value = {"mode": "cfg", "mode_name": "Charge from Grid", "remaining_minutes": 30}
+
+        await button.async_press()
+        mock_cancel.assert_awaited_once()
+        args = mock_cancel.call_args
+        assert args[0][2] == "cfg"
 
     @pytest.mark.asyncio
-    async def test_no_op_when_idle(self, button):
-        with patch(
-            "custom_components.enphase_envoy_cloud_control.timed_mode.get_active_timed_mode",
-            return_value=None,
-        ):
-            with patch(
-                "custom_components.enphase_envoy_cloud_control.timed_mode.cancel_timed_mode",
-                new_callable=AsyncMock,
-            ) as mock_cancel:
-                await button.async_press()
-                mock_cancel.assert_not_awaited()
+    async def test_no_op_when_idle(self, button, cancel_mocks):
+        _, mock_cancel = cancel_mocks
+
+        await button.async_press()
+        mock_cancel.assert_not_awaited()
@@ -9,18 +9,26 @@ import pytest
 
 from custom_components.enphase_envoy_cloud_control.coordinator import EnphaseCoordinator
 
-from .conftest import ENTRY_ID, SAMPLE_BATTERY_DATA, SAMPLE_SCHEDULES_DATA
+from .conftest import ENTRY_ID, SAMPLE_SCHEDULES_DATA
+
+
+async def _run_inline(fn, *args, **kwargs):
+    """Stand-in for hass.async_add_executor_job that runs the job in place."""
+    return fn(*args, **kwargs)
 
 
 @pytest.fixture
 def coordinator(mock_entry):
     """Create a real EnphaseCoordinator with a mocked hass."""
     hass = MagicMock()
-    hass.async_add_executor_job = AsyncMock(side_effect=lambda fn, *a, **kw: fn(*a, **kw))
+    hass.async_add_executor_job = _run_inline
     with patch(
         "custom_components.enphase_envoy_cloud_control.coordinator.DataUpdateCoordinator.__init__"
     ):
         coord = EnphaseCoordinator(hass, mock_entry)
+    coord.client.ensure_authenticated = MagicMock(
+        return_value={"user_id": "12345", "battery_id": "67890"}
+    )
     return coord
 
 
@@ -52,81 +60,79 @@ class TestConstructor:
 
 
 # ---------------------------------------------------------------------------
-# _fetch
+# _merge / _async_fetch
 # ---------------------------------------------------------------------------
-class TestFetch:
-    def test_merges_schedule_details(self, coordinator):
-        coordinator.client.battery_settings = MagicMock(return_value=SAMPLE_BATTERY_DATA)
-        coordinator.client.get_schedules = MagicMock(return_value=SAMPLE_SCHEDULES_DATA)
-
-        result = coordinator._fetch()
+class TestMerge:
+    def test_merges_schedule_details(self, coordinator, battery_data):
+        result = coordinator._merge(battery_data, SAMPLE_SCHEDULES_DATA["data"])
 
         assert "data" in result
         assert "schedules" in result
-        assert "schedules_raw" in result
+        assert "schedules_raw" not in result
 
     def test_handles_missing_schedule_data(self, coordinator):
-        coordinator.client.battery_settings = MagicMock(return_value={"data": {}})
-        coordinator.client.get_schedules = MagicMock(return_value={})
-
-        result = coordinator._fetch()
+        result = coordinator._merge({}, {})
         assert result["data"] == {}
 
     def test_caches_last_schedules(self, coordinator):
-        coordinator.client.battery_settings = MagicMock(return_value={})
-        schedules = {"data": {"cfg": {"details": []}}}
-        coordinator.client.get_schedules = MagicMock(return_value=schedules)
+        schedules = {"cfg": {"details": []}}
 
-        coordinator._fetch()
+        coordinator._merge({}, schedules)
         assert coordinator.client._last_schedules == schedules
 
     def test_merges_schedule_details_into_control(self, coordinator):
         battery = {
-            "data": {
-                "cfgControl": {
-                    "schedules": [
-                        {"startTime": None, "endTime": None}
-                    ]
-                }
+            "cfgControl": {
+                "schedules": [
+                    {"startTime": None, "endTime": None}
+                ]
             }
         }
         schedules = {
-            "data": {
-                "cfg": {
-                    "details": [
-                        {
-                            "scheduleId": "real-id",
-                            "startTime": "06:00",
-                            "endTime": "10:00",
-                            "limit": 80,
-                            "days": [1, 2],
-                        }
-                    ]
-                }
+            "cfg": {
+                "details": [
+                    {
+                        "scheduleId": "real-id",
+                        "startTime": "06:00",
+                        "endTime": "10:00",
+                        "limit": 80,
+                        "days": [1, 2],
+                    }
+                ]
             }
         }
-        coordinator.client.battery_settings = MagicMock(return_value=battery)
-        coordinator.client.get_schedules = MagicMock(return_value=schedules)
-
-        result = coordinator._fetch()
+        result = coordinator._merge(battery, schedules)
         merged_sched = result["data"]["cfgControl"]["schedules"][0]
         assert merged_sched["startTime"] == "06:00"
         assert merged_sched["endTime"] == "10:00"
         assert merged_sched["scheduleId"] == "real-id"
         assert merged_sched["limit"] == 80
 
-    def test_fetch_raises_on_error(self, coordinator):
-        coordinator.client.battery_settings = MagicMock(side_effect=Exception("API error"))
+    def test_handles_none_battery_data(self, coordinator):
+        result = coordinator._merge(None, None)
+        assert result is not None
 
-        with pytest.raises(Exception, match="API error"):
-            coordinator._fetch()
 
-    def test_handles_none_battery_data(self, coordinator):
-        coordinator.client.battery_settings = MagicMock(return_value=None)
-        coordinator.client.get_schedules = MagicMock(return_value=None)
+class TestAsyncFetch:
+    @pytest.mark.asyncio
+    async def test_authenticates_once_then_fetches_both(self, coordinator, battery_data):
+        coordinator.client.battery_settings = MagicMock(return_value=battery_data)
+        coordinator.client.get_schedules = MagicMock(return_value=SAMPLE_SCHEDULES_DATA["data"])
 
-        result = coordinator._fetch()
-        assert result is not None
+        result = await coordinator._async_fetch()
+
+        coordinator.client.ensure_authenticated.assert_called_once()
+        coordinator.client.battery_settings.assert_called_once()
+        coordinator.client.get_schedules.assert_called_once()
+        assert result["schedules"] == SAMPLE_SCHEDULES_DATA["data"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_raises_on_error(self, coordinator):
+        coordinator.client.battery_settings = MagicMock(side_effect=Exception("API error"))
+        coordinator.client.get_schedules = MagicMock(return_value={})
+
+        with pytest.raises(Exception, match="API error"):
+            await coordinator._async_fetch()
 
 
 # ---------------------------------------------------------------------------
@@ -135,7 +141,7 @@ class TestFetch:
 class TestAsyncUpdateData:
     @pytest.mark.asyncio
     async def test_sets_timestamps(self, coordinator):
-        coordinator.client.battery_settings = MagicMock(return_value={"data": {}})
+        coordinator.client.battery_settings = MagicMock(return_value={})
         coordinator.client.get_schedules = MagicMock(return_value={})
 
         result = await coordinator._async_update_data()
@@ -146,54 +152,173 @@ class TestAsyncUpdateData:
     @pytest.mark.asyncio
     async def test_wraps_errors_in_update_failed(self, coordinator):
         coordinator.client.battery_settings = MagicMock(side_effect=Exception("fail"))
+        coordinator.client.get_schedules = MagicMock(return_value={})
+
+        from homeassistant.helpers.update_coordinator import UpdateFailed
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    async def test_backs_off_after_failures(self, coordinator):
+        coordinator.client.battery_settings = MagicMock(side_effect=Exception("fail"))
+        coordinator.client.get_schedules = MagicMock(return_value={})
+
+        from homeassistant.helpers.update_coordinator import UpdateFailed
+        for expected in (60, 120, 240):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+            assert coordinator.update_interval == timedelta(seconds=expected)
+
+    @pytest.mark.asyncio
+    async def test_backoff_capped(self, coordinator):
+        coordinator.client.battery_settings = MagicMock(side_effect=Exception("fail"))
+        coordinator.client.get_schedules = MagicMock(return_value={})
+
+        from homeassistant.helpers.update_coordinator import UpdateFailed
+        for _ in range(10):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=900)
+
+    def test_backoff_survives_long_outage(self, coordinator):
+        coordinator._fail_count = 2000
+        coordinator._back_off()
+        assert coordinator._fail_count == 2001
+        assert coordinator.update_interval == timedelta(seconds=900)
+
+    @pytest.mark.asyncio
+    async def test_success_resets_interval(self, coordinator):
+        coordinator.client.battery_settings = MagicMock(side_effect=Exception("fail"))
+        coordinator.client.get_schedules = MagicMock(return_value={})
 
         from homeassistant.helpers.update_coordinator import UpdateFailed
         with pytest.raises(UpdateFailed):
             await coordinator._async_update_data()
 
+        coordinator.client.battery_settings = MagicMock(return_value={})
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=30)
+
 
 # ---------------------------------------------------------------------------
 # async_initialize_auth
 # ---------------------------------------------------------------------------
 class TestAsyncInitializeAuth:
+    @staticmethod
+    def _auth_returns(coordinator, ids):
+        """Stub ensure_authenticated and return the config_entries mock to assert on."""
+        coordinator.client.ensure_authenticated = MagicMock(return_value=ids)
+        return coordinator.hass.config_entries
+
     @pytest.mark.asyncio
     async def test_persists_discovered_ids(self, coordinator, mock_entry):
-        coordinator.client.load_cache = MagicMock()
-        coordinator.client.ensure_authenticated = MagicMock(
-            return_value={"user_id": "discovered_uid", "battery_id": "discovered_bid"}
+        entries = self._auth_returns(
+            coordinator, {"user_id": "11111", "battery_id": "22222"}
         )
         mock_entry.data = {"email": "test@example.com", "password": "secret"}
 
-        coordinator.hass.config_entries = MagicMock()
-
         await coordinator.async_initialize_auth()
 
-        coordinator.hass.config_entries.async_update_entry.assert_called_once()
-        call_kwargs = coordinator.hass.config_entries.async_update_entry.call_args
+        entries.async_update_entry.assert_called_once()
+        call_kwargs = entries.async_update_entry.call_args
         updated_data = call_kwargs.kwargs.get("data") or call_kwargs[1].get("data")
-        assert updated_data["user_id"] == "discovered_uid"
-        assert updated_data["battery_id"] == "discovered_bid"
+        assert updated_data["user_id"] == "11111"
+        assert updated_data["battery_id"] == "22222"
 
     @pytest.mark.asyncio
-    async def test_no_update_when_ids_present(self, coordinator, mock_entry):
-        coordinator.client.load_cache = MagicMock()
-        coordinator.client.ensure_authenticated = MagicMock(
-            return_value={"user_id": "12345", "battery_id": "67890"}
-        )
+    async def test_replaces_malformed_stored_id(self, coordinator, mock_entry):
+        entries = self._auth_returns(coordinator, {"user_id": "12345", "battery_id": "22222"})
+        mock_entry.data = {**mock_entry.data, "battery_id": "site-1"}
+
+        await coordinator.async_initialize_auth()
 
-        coordinator.hass.config_entries = MagicMock()
+        updated_data = entries.async_update_entry.call_args.kwargs["data"]
+        assert updated_data["battery_id"] == "22222"
+
+    @pytest.mark.asyncio
+    async def test_no_update_when_ids_present(self, coordinator, mock_entry):
+        entries = self._auth_returns(coordinator, {"user_id": "12345", "battery_id": "67890"})
 
         await coordinator.async_initialize_auth()
 
-        coordinator.hass.config_entries.async_update_entry.assert_not_called()
+        entries.async_update_entry.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_no_update_when_auth_returns_none(self, coordinator, mock_entry):
-        coordinator.client.load_cache = MagicMock()
-        coordinator.client.ensure_authenticated = MagicMock(return_value=None)
-
-        coordinator.hass.config_entries = MagicMock()
+        entries = self._auth_returns(coordinator, None)
 
         await coordinator.async_initialize_auth()
 
-        coordinator.hass.config_entries.async_update_entry.assert_not_called()
+        entries.async_update_entry.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Settled refresh after mode changes
+# ---------------------------------------------------------------------------
+class TestSettledRefresh:
+    @pytest.mark.asyncio
+    async def test_goes_through_debouncer(self, coordinator):
+        coordinator._settle_debouncer = MagicMock(async_call=AsyncMock())
+        await coordinator.async_request_settled_refresh()
+        await coordinator.async_request_settled_refresh()
+        assert coordinator._settle_debouncer.async_call.await_count == 2
+
+    def test_debouncer_targets_force_refresh(self, coordinator):
+        debouncer = coordinator._settle_debouncer
+        assert debouncer.immediate is False
+        assert debouncer.function == coordinator.async_force_refresh
+
+
+# ---------------------------------------------------------------------------
+# Background schedule fetch
+# ---------------------------------------------------------------------------
+class TestEnsureSchedulesLoaded:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self, coordinator):
+        import asyncio
+
+        coordinator.client.get_schedules = MagicMock(return_value={"cfg": {"details": []}})
+        coordinator.async_update_listeners = MagicMock()
+        await asyncio.gather(
+            coordinator.async_ensure_schedules_loaded(),
+            coordinator.async_ensure_schedules_loaded(),
+            coordinator.async_ensure_schedules_loaded(),
+        )
+        coordinator.client.get_schedules.assert_called_once()
+        coordinator.async_update_listeners.assert_called_once()
+        assert coordinator.client._last_schedules == {"cfg": {"details": []}}
+
+    @pytest.mark.asyncio
+    async def test_failure_not_retried(self, coordinator):
+        coordinator.client.get_schedules = MagicMock(side_effect=RuntimeError("boom"))
+        coordinator.async_update_listeners = MagicMock()
+        await coordinator.async_ensure_schedules_loaded()
+        await coordinator.async_ensure_schedules_loaded()
+        coordinator.client.get_schedules.assert_called_once()
+        coordinator.async_update_listeners.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_updates_schedule_sensor(self, coordinator):
+        from custom_components.enphase_envoy_cloud_control.sensor import EnphaseScheduleSensor
+
+        coordinator.data = {"data": {}}
+        coordinator.client.get_schedules = MagicMock(
+            return_value={"cfg": {"details": [{"scheduleId": "c1", "startTime": "01:00", "endTime": "02:00"}]}}
+        )
+        coordinator.async_update_listeners = MagicMock()
+        sensor = EnphaseScheduleSensor(coordinator, "cfg")
+        assert sensor.state == "No schedules"
+
+        # Run the background fetch the sensor scheduled on its first read.
+        (fetch,), _ = coordinator.hass.async_create_task.call_args
+        await fetch
+
+        coordinator.async_update_listeners.assert_called_once()
+        assert "01:00" in sensor.state
+
+    @pytest.mark.asyncio
+    async def test_skips_when_cached(self, coordinator):
+        coordinator.client._last_schedules = {}
+        coordinator.client.get_schedules = MagicMock()
+        await coordinator.async_ensure_schedules_loaded()
+        coordinator.client.get_schedules.assert_not_called()
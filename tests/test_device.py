@@ -1,5 +1,7 @@
 """Tests for device.py — pure device info functions."""
 
+import pytest
+
 from custom_components.enphase_envoy_cloud_control.const import (
     DEVICE_KIND_SCHEDULE_EDITOR,
     DOMAIN,
@@ -9,27 +11,34 @@ from custom_components.enphase_envoy_cloud_control.device import (
     schedule_editor_device_info,
 )
 
+pytestmark = pytest.mark.pure
 
-def test_battery_device_info_identifiers():
-    info = battery_device_info("entry1")
-    assert info["identifiers"] == {(DOMAIN, "entry1")}
-
-
-def test_battery_device_info_fields():
-    info = battery_device_info("entry1")
-    assert info["name"] == "Enphase Battery"
-    assert info["manufacturer"] == "Enphase"
-    assert info["model"] == "IQ Battery"
-
+BATTERY_INFO = battery_device_info("entry1")
+EDITOR_INFO = schedule_editor_device_info("entry1")
 
-def test_schedule_editor_device_info_identifiers():
-    info = schedule_editor_device_info("entry1")
-    assert info["identifiers"] == {(DOMAIN, "entry1", DEVICE_KIND_SCHEDULE_EDITOR)}
 
-
-def test_schedule_editor_device_info_via_device():
-    info = schedule_editor_device_info("entry1")
-    assert info["via_device"] == (DOMAIN, "entry1")
-    assert info["name"] == "Enphase Schedule Editor"
-    assert info["manufacturer"] == "Enphase"
-    assert info["model"] == "Schedule Editor"
+@pytest.mark.parametrize(
+    "key,expected",
+    [
+        ("identifiers", {(DOMAIN, "entry1")}),
+        ("name", "Enphase Battery"),
+        ("manufacturer", "Enphase"),
+        ("model", "IQ Battery"),
+    ],
+)
+def test_battery_device_info(key, expected):
+    assert BATTERY_INFO[key] == expected
+
+
+@pytest.mark.parametrize(
+    "key,expected",
+    [
+        ("identifiers", {(DOMAIN, "entry1", DEVICE_KIND_SCHEDULE_EDITOR)}),
+        ("via_device", (DOMAIN, "entry1")),
+        ("name", "Enphase Schedule Editor"),
+        ("manufacturer", "Enphase"),
+        ("model", "Schedule Editor"),
+    ],
+)
+def test_schedule_editor_device_info(key, expected):
+    assert EDITOR_INFO[key] == expected
@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 from datetime import time
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from custom_components.enphase_envoy_cloud_control.editor import (
     DAY_KEY_BY_INDEX,
     DAY_ORDER,
-    _collect_schedules,
+    EditorStateMixin,
     _normalize_days,
     _normalize_time,
+    collect_schedules,
     days_list_from_editor,
     default_day_flags,
     default_editor_state,
@@ -21,19 +22,21 @@ from custom_components.enphase_envoy_cloud_control.editor import (
     normalize_schedules,
 )
 
+pytestmark = pytest.mark.pure
+
+DAY_KEYS = tuple(key for key, _ in DAY_ORDER)
+ALL_FALSE_FLAGS = dict.fromkeys(DAY_KEYS, False)
+
 
 # ---------------------------------------------------------------------------
 # default_day_flags
 # ---------------------------------------------------------------------------
 class TestDefaultDayFlags:
     def test_all_false(self):
-        flags = default_day_flags()
-        assert all(v is False for v in flags.values())
+        assert default_day_flags() == ALL_FALSE_FLAGS
 
     def test_keys(self):
-        flags = default_day_flags()
-        expected_keys = [key for key, _ in DAY_ORDER]
-        assert list(flags.keys()) == expected_keys
+        assert tuple(default_day_flags()) == DAY_KEYS
 
 
 # ---------------------------------------------------------------------------
@@ -66,25 +69,23 @@ class TestDefaultStates:
 # editor_days_from_list / days_list_from_editor
 # ---------------------------------------------------------------------------
 class TestDayConversions:
-    def test_round_trip(self):
-        original = [1, 3, 5, 7]
-        flags = editor_days_from_list(original)
-        result = days_list_from_editor(flags)
-        assert result == original
+    @pytest.mark.parametrize(
+        "days",
+        [(1, 3, 5, 7), (1, 2, 3, 4, 5, 6, 7), (3,), ()],
+        ids=["mixed", "all", "single", "empty"],
+    )
+    def test_round_trip(self, days):
+        flags = editor_days_from_list(list(days))
+        assert tuple(days_list_from_editor(flags)) == days
 
     def test_empty_list(self):
-        flags = editor_days_from_list([])
-        assert all(v is False for v in flags.values())
-        assert days_list_from_editor(flags) == []
+        assert editor_days_from_list([]) == ALL_FALSE_FLAGS
 
     def test_all_days(self):
-        flags = editor_days_from_list([1, 2, 3, 4, 5, 6, 7])
-        assert all(flags.values())
-        assert days_list_from_editor(flags) == [1, 2, 3, 4, 5, 6, 7]
+        assert all(editor_days_from_list([1, 2, 3, 4, 5, 6, 7]).values())
 
     def test_invalid_day_ignored(self):
-        flags = editor_days_from_list([0, 8, 99])
-        assert all(v is False for v in flags.values())
+        assert editor_days_from_list([0, 8, 99]) == ALL_FALSE_FLAGS
 
     def test_single_day(self):
         flags = editor_days_from_list([3])
@@ -95,210 +96,177 @@ class TestDayConversions:
 # ---------------------------------------------------------------------------
 # _normalize_time
 # ---------------------------------------------------------------------------
-class TestNormalizeTime:
-    def test_time_object(self):
-        assert _normalize_time(time(14, 30)) == "14:30"
-
-    def test_time_midnight(self):
-        assert _normalize_time(time(0, 0)) == "00:00"
-
-    def test_none(self):
-        assert _normalize_time(None) == "00:00"
-
-    def test_int(self):
-        assert _normalize_time(8) == "08:00"
-
-    def test_float(self):
-        assert _normalize_time(23.5) == "23:00"
-
-    def test_string_hhmm(self):
-        assert _normalize_time("09:45") == "09:45"
-
-    def test_string_with_seconds(self):
-        assert _normalize_time("09:45:30") == "09:45"
-
-    def test_string_embedded(self):
-        assert _normalize_time("time is 14:30 today") == "14:30"
-
-    def test_short_string_no_match(self):
-        result = _normalize_time("abc")
-        assert result == "abc"[:5]
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        pytest.param(time(14, 30), "14:30", id="time-object"),
+        pytest.param(time(0, 0), "00:00", id="time-midnight"),
+        pytest.param(None, "00:00", id="none"),
+        pytest.param(8, "08:00", id="int"),
+        pytest.param(23.5, "23:00", id="float"),
+        pytest.param("09:45", "09:45", id="string-hhmm"),
+        pytest.param("09:45:30", "09:45", id="string-with-seconds"),
+        pytest.param("time is 14:30 today", "14:30", id="string-embedded"),
+        pytest.param("abc", "abc", id="short-string-no-match"),
+    ],
+)
+def test_normalize_time(value, expected):
+    assert _normalize_time(value) == expected
 
 
 # ---------------------------------------------------------------------------
 # _normalize_days
 # ---------------------------------------------------------------------------
-class TestNormalizeDays:
-    def test_list_of_ints(self):
-        assert _normalize_days([3, 1, 5]) == [1, 3, 5]
-
-    def test_dict_with_enabled(self):
-        raw = {"1": True, "3": True, "5": False}
-        assert _normalize_days(raw) == [1, 3]
-
-    def test_string_csv(self):
-        assert _normalize_days("1,3,5") == [1, 3, 5]
-
-    def test_string_space_separated(self):
-        assert _normalize_days("2 4 6") == [2, 4, 6]
-
-    def test_empty_list(self):
-        assert _normalize_days([]) == []
-
-    def test_none(self):
-        assert _normalize_days(None) == []
-
-    def test_empty_string(self):
-        assert _normalize_days("") == []
-
-    def test_out_of_range_filtered(self):
-        assert _normalize_days([0, 1, 8, 3]) == [1, 3]
-
-    def test_duplicates_removed(self):
-        assert _normalize_days([1, 1, 3, 3]) == [1, 3]
-
-    def test_tuple_input(self):
-        assert _normalize_days((5, 2, 7)) == [2, 5, 7]
-
-    def test_set_input(self):
-        result = _normalize_days({1, 4})
-        assert sorted(result) == [1, 4]
-
-    def test_non_digit_values_skipped(self):
-        assert _normalize_days(["Mon", "1", "abc", "3"]) == [1, 3]
-
-    def test_dict_non_digit_keys_ignored(self):
-        raw = {"mon": True, "1": True, "abc": True}
-        assert _normalize_days(raw) == [1]
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        pytest.param([3, 1, 5], [1, 3, 5], id="list-of-ints"),
+        pytest.param({"1": True, "3": True, "5": False}, [1, 3], id="dict-with-enabled"),
+        pytest.param("1,3,5", [1, 3, 5], id="string-csv"),
+        pytest.param("2 4 6", [2, 4, 6], id="string-space-separated"),
+        pytest.param([], [], id="empty-list"),
+        pytest.param(None, [], id="none"),
+        pytest.param("", [], id="empty-string"),
+        pytest.param([0, 1, 8, 3], [1, 3], id="out-of-range-filtered"),
+        pytest.param([1, 1, 3, 3], [1, 3], id="duplicates-removed"),
+        pytest.param((5, 2, 7), [2, 5, 7], id="tuple"),
+        pytest.param({1, 4}, [1, 4], id="set"),
+        pytest.param(["Mon", "1", "abc", "3"], [1, 3], id="non-digit-values-skipped"),
+        pytest.param({"mon": True, "1": True, "abc": True}, [1], id="dict-non-digit-keys-ignored"),
+    ],
+)
+def test_normalize_days(raw, expected):
+    assert _normalize_days(raw) == expected
 
 
 # ---------------------------------------------------------------------------
-# _collect_schedules — 4-level fallback
+# collect_schedules — 4-level fallback
 # ---------------------------------------------------------------------------
-class TestCollectSchedules:
-    def _make_coordinator(self, data):
-        coord = MagicMock()
-        coord.data = data
-        coord.client = MagicMock(spec=[])  # no _last_schedules by default
-        return coord
-
-    def test_primary_path(self):
-        coord = self._make_coordinator({
-            "data": {
-                "cfgControl": {
-                    "schedules": [{"scheduleId": "s1"}]
-                }
-            }
-        })
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s1"}]
-
-    def test_fallback_schedules_dict_details(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {
-                "cfg": {"details": [{"scheduleId": "s2"}]}
-            },
-        })
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s2"}]
-
-    def test_fallback_schedules_list(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {
-                "cfg": [{"scheduleId": "s3"}]
-            },
-        })
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s3"}]
-
-    def test_fallback_schedules_data_inner(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {
-                "data": {
-                    "cfg": {"details": [{"scheduleId": "s4"}]}
-                }
-            },
-        })
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s4"}]
-
-    def test_fallback_schedules_data_inner_list(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {
-                "data": {
-                    "cfg": [{"scheduleId": "s5"}]
-                }
-            },
-        })
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s5"}]
-
-    def test_fallback_client_cache_details(self):
-        coord = self._make_coordinator({"data": {}})
-        coord.client._last_schedules = {
-            "cfg": {"details": [{"scheduleId": "s6"}]}
-        }
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s6"}]
-
-    def test_fallback_client_cache_list(self):
-        coord = self._make_coordinator({"data": {}})
-        coord.client._last_schedules = {
-            "cfg": [{"scheduleId": "s7"}]
-        }
-        result = _collect_schedules(coord, "cfg")
-        assert result == [{"scheduleId": "s7"}]
-
-    def test_returns_empty_when_no_data(self):
-        coord = self._make_coordinator(None)
-        result = _collect_schedules(coord, "cfg")
-        assert result == []
-
-    def test_returns_empty_when_empty_data(self):
-        coord = self._make_coordinator({"data": {}})
-        result = _collect_schedules(coord, "cfg")
-        assert result == []
+_NO_CACHE = object()
+
+# (coordinator.data, client._last_schedules, mode, expected)
+COLLECT_CASES = [
+    pytest.param(
+        {"data": {"cfgControl": {"schedules": [{"scheduleId": "s1"}]}}},
+        _NO_CACHE,
+        "cfg",
+        [{"scheduleId": "s1"}],
+        id="primary_path",
+    ),
+    pytest.param(
+        {"data": {}, "schedules": {"dtg": {"details": [{"scheduleId": "s2"}]}}},
+        _NO_CACHE,
+        "dtg",
+        [{"scheduleId": "s2"}],
+        id="schedules_dict_details",
+    ),
+    pytest.param(
+        {"data": {}, "schedules": {"rbd": [{"scheduleId": "s3"}]}},
+        _NO_CACHE,
+        "rbd",
+        [{"scheduleId": "s3"}],
+        id="schedules_list",
+    ),
+    pytest.param(
+        {"data": {}, "schedules": {"data": {"cfg": {"details": [{"scheduleId": "s4"}]}}}},
+        _NO_CACHE,
+        "cfg",
+        [{"scheduleId": "s4"}],
+        id="schedules_data_inner",
+    ),
+    pytest.param(
+        {"data": {}, "schedules": {"data": {"cfg": [{"scheduleId": "s5"}]}}},
+        _NO_CACHE,
+        "cfg",
+        [{"scheduleId": "s5"}],
+        id="schedules_data_inner_list",
+    ),
+    pytest.param(
+        {"data": {}},
+        {"cfg": {"details": [{"scheduleId": "s6"}]}},
+        "cfg",
+        [{"scheduleId": "s6"}],
+        id="client_cache_details",
+    ),
+    pytest.param(
+        {"data": {}},
+        {"cfg": [{"scheduleId": "s7"}]},
+        "cfg",
+        [{"scheduleId": "s7"}],
+        id="client_cache_list",
+    ),
+    pytest.param(None, _NO_CACHE, "cfg", [], id="no_data"),
+    pytest.param({"data": {}}, _NO_CACHE, "cfg", [], id="empty_data"),
+    pytest.param({"data": {"cfgControl": None}}, _NO_CACHE, "cfg", [], id="null_control_block"),
+]
+
+
+def _make_coordinator(data, last_schedules=_NO_CACHE):
+    """Plain stand-in coordinator; the editor helpers only read .data and .client."""
+    client = SimpleNamespace()  # no _last_schedules by default
+    if last_schedules is not _NO_CACHE:
+        client._last_schedules = last_schedules
+    return SimpleNamespace(data=data, client=client)
+
+
+@pytest.mark.parametrize("data,cache,mode,expected", COLLECT_CASES)
+def test_collect_schedules_paths(data, cache, mode, expected):
+    assert collect_schedules(_make_coordinator(data, cache), mode) == expected
 
 
 # ---------------------------------------------------------------------------
 # normalize_schedules
 # ---------------------------------------------------------------------------
 class TestNormalizeSchedules:
-    def _make_coordinator(self, data):
-        coord = MagicMock()
-        coord.data = data
-        coord.client = MagicMock(spec=[])
-        return coord
-
-    def test_basic_normalization(self):
-        coord = self._make_coordinator({
-            "data": {
-                "cfgControl": {
-                    "schedules": [
-                        {
-                            "scheduleId": "abc123",
-                            "scheduleType": "CFG",
-                            "startTime": "06:00",
-                            "endTime": "10:00",
-                            "limit": 80,
-                            "days": [1, 2, 3],
-                        }
-                    ]
-                }
-            }
-        })
-        result = normalize_schedules(coord)
-        assert len(result) == 1
-        assert result[0]["id"] == "abc123"
-        assert result[0]["type"] == "cfg"
-        assert result[0]["start"] == "06:00"
-        assert result[0]["end"] == "10:00"
-        assert result[0]["limit"] == 80
-        assert result[0]["days"] == [1, 2, 3]
+    _make_coordinator = staticmethod(_make_coordinator)
+
+    @pytest.mark.parametrize(
+        "control,raw,expected",
+        [
+            pytest.param(
+                "cfgControl",
+                {
+                    "scheduleId": "abc123",
+                    "scheduleType": "CFG",
+                    "startTime": "06:00",
+                    "endTime": "10:00",
+                    "limit": 80,
+                    "days": [1, 2, 3],
+                },
+                {
+                    "id": "abc123",
+                    "type": "cfg",
+                    "start": "06:00",
+                    "end": "10:00",
+                    "limit": 80,
+                    "days": [1, 2, 3],
+                },
+                id="basic",
+            ),
+            pytest.param(
+                "cfgControl",
+                {"scheduleId": "s1", "powerLimit": 50},
+                {"limit": 50},
+                id="powerLimit_fallback",
+            ),
+            pytest.param(
+                "cfgControl",
+                {"scheduleId": "s1", "daysOfWeek": [6, 7]},
+                {"days": [6, 7]},
+                id="daysOfWeek_fallback",
+            ),
+            pytest.param(
+                "dtgControl",
+                {"scheduleId": "s1"},
+                {"type": "dtg"},
+                id="type_defaults_to_mode",
+            ),
+        ],
+    )
+    def test_single_schedule(self, control, raw, expected):
+        coord = self._make_coordinator({"data": {control: {"schedules": [raw]}}})
+        (result,) = normalize_schedules(coord)
+        assert {key: result[key] for key in expected} == expected
 
     def test_skips_entries_without_schedule_id(self):
         coord = self._make_coordinator({
@@ -326,43 +294,22 @@ class TestNormalizeSchedules:
         assert "s1" in ids
         assert "s2" in ids
 
-    def test_powerLimit_fallback(self):
-        coord = self._make_coordinator({
-            "data": {
-                "cfgControl": {
-                    "schedules": [
-                        {"scheduleId": "s1", "powerLimit": 50}
-                    ]
-                }
-            }
-        })
-        result = normalize_schedules(coord)
-        assert result[0]["limit"] == 50
-
-    def test_daysOfWeek_fallback(self):
-        coord = self._make_coordinator({
-            "data": {
-                "cfgControl": {
-                    "schedules": [
-                        {"scheduleId": "s1", "daysOfWeek": [6, 7]}
-                    ]
-                }
-            }
-        })
-        result = normalize_schedules(coord)
-        assert result[0]["days"] == [6, 7]
-
-    def test_type_defaults_to_mode(self):
-        coord = self._make_coordinator({
-            "data": {
-                "dtgControl": {
-                    "schedules": [{"scheduleId": "s1"}]
-                }
-            }
-        })
-        result = normalize_schedules(coord)
-        assert result[0]["type"] == "dtg"
-
     def test_empty_data(self):
         coord = self._make_coordinator(None)
         assert normalize_schedules(coord) == []
+
+
+# ---------------------------------------------------------------------------
+# EditorStateMixin
+# ---------------------------------------------------------------------------
+class TestEditorStateMixin:
+    def test_resolves_editor_once(self, mock_hass, new_editor_state):
+        from .conftest import ENTRY_ID
+
+        entity = EditorStateMixin()
+        entity.hass = mock_hass
+        entity.entry_id = ENTRY_ID
+        entity._editor_key = "new_editor"
+        assert entity._editor is new_editor_state
+        mock_hass.data = {}
+        assert entity._editor is new_editor_state
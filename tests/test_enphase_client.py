@@ -3,38 +3,109 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import time as _time
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch, PropertyMock
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from custom_components.enphase_envoy_cloud_control.enphase_client import (
     AuthError,
     EnphaseClient,
+    _b64url_decode,
+    _jwt_payload_json,
 )
 
 
 # ---------------------------------------------------------------------------
 # Helper to create a valid-looking JWT for testing
 # ---------------------------------------------------------------------------
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+_JWT_HEADER = _b64url(json.dumps({"alg": "HS256"}).encode())
+_JWT_SIG = _b64url(b"fakesig")
+
+
+@functools.lru_cache(maxsize=None)
+def _encode_jwt(claims: tuple) -> str:
+    body = _b64url(json.dumps(dict(claims)).encode())
+    return f"{_JWT_HEADER}.{body}.{_JWT_SIG}"
+
+
 def _make_jwt(payload: dict | None = None, exp: int | None = None) -> str:
-    """Create a fake JWT with the given payload."""
-    header = base64.urlsafe_b64encode(json.dumps({"alg": "HS256"}).encode()).decode().rstrip("=")
-    if payload is None:
-        payload = {}
+    """Create a fake JWT with the given payload; identical claims reuse one token."""
+    claims = dict(payload or {})
     if exp is not None:
-        payload["exp"] = exp
-    body = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
-    sig = base64.urlsafe_b64encode(b"fakesig").decode().rstrip("=")
-    return f"{header}.{body}.{sig}"
+        claims["exp"] = exp
+    return _encode_jwt(tuple(claims.items()))
+
+
+# Fixed instants keep the canonical tokens stable for the whole run.
+_FIXED_NOW = 1_700_000_000
+_FAR_FUTURE_EXP = 2_000_000_000
+_VALID_JWT = _make_jwt(exp=_FAR_FUTURE_EXP)
+_EXPIRED_JWT = _make_jwt(exp=_FIXED_NOW - 3600)
+_NEAR_EXP_JWT = _make_jwt(exp=_FIXED_NOW + 1800)
+
+
+def _resp(status_code: int = 200, payload: Any = None, **attrs) -> SimpleNamespace:
+    """Return a plain stand-in for requests.Response with only what the client reads."""
+    content = b"" if payload is None else json.dumps(payload).encode()
+    fields = {
+        "status_code": status_code,
+        "ok": status_code < 400,
+        "content": content,
+        "text": content.decode(),
+        "encoding": None,
+        "url": "",
+        "headers": {},
+        "cookies": {},
+        "raise_for_status": lambda: None,
+    }
+    fields.update(attrs)
+    return SimpleNamespace(**fields)
+
+
+def _sent_payload(call) -> dict:
+    """Return the JSON body of a mocked SESSION call, however it was encoded."""
+    if call.kwargs.get("data") is not None:
+        return json.loads(call.kwargs["data"])
+    return call.kwargs.get("json")
 
 
 @pytest.fixture
 def client():
-    """Create a fresh EnphaseClient."""
-    return EnphaseClient("test@example.com", "secret", "12345", "67890")
+    """Create a fresh EnphaseClient that will not read the on-disk cache."""
+    client = EnphaseClient("test@example.com", "secret", "12345", "67890")
+    client._cache_loaded = True
+    return client
+
+
+@pytest.fixture
+def authed_session(client):
+    """Patch SESSION and give *client* valid tokens and a non-empty cookie jar."""
+    client.jwt_token = "jwt"
+    client.xsrf_token = "xsrf"
+    client.jwt_exp = _FAR_FUTURE_EXP
+    with patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION") as session:
+        session.cookies = MagicMock()
+        session.cookies.__bool__ = lambda self: True
+        yield session
+
+
+class TestAuthHeaders:
+    def test_username_tracks_user_id(self, client):
+        assert client._auth_headers("jwt", "xsrf")["username"] == "12345"
+        client.user_id = 999
+        headers = client._auth_headers("jwt", "xsrf")
+        assert headers["username"] == "999"
+        assert headers["cookie"] == "BP-XSRF-Token=xsrf"
 
 
 # ---------------------------------------------------------------------------
@@ -90,6 +161,17 @@ class TestJwtPayloadJson:
     def test_invalid_base64_returns_empty(self, client):
         assert client._jwt_payload_json("a.!!!.c") == {}
 
+    def test_decode_cached_per_token(self, client):
+        module = "custom_components.enphase_envoy_cloud_control.enphase_client"
+        jwt = _make_jwt({"sub": "user1"})
+        _jwt_payload_json.cache_clear()
+        with patch(f"{module}._b64url_decode", wraps=_b64url_decode) as dec:
+            client._jwt_payload_json(jwt)
+            client._jwt_payload_json(jwt)
+            assert dec.call_count == 1
+            client._jwt_payload_json(_make_jwt({"sub": "user2"}))
+            assert dec.call_count == 2
+
 
 class TestJwtExp:
     def test_valid(self, client):
@@ -109,26 +191,22 @@ class TestJwtValid:
         client.jwt_token = None
         assert client._jwt_valid() is False
 
-    def test_expired_token(self, client):
-        # Set exp to 1 hour ago — fails the 1-hour grace check
-        past_exp = int(datetime.now(timezone.utc).timestamp()) - 3600
-        client.jwt_token = _make_jwt(exp=past_exp)
-        client.jwt_exp = past_exp
-        assert client._jwt_valid() is False
+    @pytest.mark.parametrize(
+        "token,expected",
+        [
+            # exp 1 hour ago — fails the 1-hour grace check
+            pytest.param(_EXPIRED_JWT, False, id="expired"),
+            pytest.param(_VALID_JWT, True, id="valid"),
+            # exp 30 min from now — within 1h grace, so invalid
+            pytest.param(_NEAR_EXP_JWT, False, id="within-grace-period"),
+        ],
+    )
+    def test_token_expiry(self, client, token, expected):
+        from freezegun import freeze_time
 
-    def test_valid_token(self, client):
-        # Set exp far in the future
-        future_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-        client.jwt_token = _make_jwt(exp=future_exp)
-        client.jwt_exp = future_exp
-        assert client._jwt_valid() is True
-
-    def test_token_within_grace_period(self, client):
-        # exp exactly 30 min from now — within 1h grace, so invalid
-        near_exp = int(datetime.now(timezone.utc).timestamp()) + 1800
-        client.jwt_token = _make_jwt(exp=near_exp)
-        client.jwt_exp = near_exp
-        assert client._jwt_valid() is False
+        client.jwt_token = token
+        with freeze_time(datetime.fromtimestamp(_FIXED_NOW, timezone.utc)):
+            assert client._jwt_valid() is expected
 
 
 class TestNowIso:
@@ -140,122 +218,83 @@ class TestNowIso:
         dt = datetime.fromisoformat(result.replace("Z", "+00:00"))
         assert dt.tzinfo is not None
 
+    def test_milliseconds_utc(self, client):
+        with patch(
+            "custom_components.enphase_envoy_cloud_control.enphase_client.time.time",
+            return_value=1700000000.1234,
+        ):
+            assert client._now_iso() == "2023-11-14T22:13:20.123Z"
+
 
 # ---------------------------------------------------------------------------
 # API methods — patch SESSION
 # ---------------------------------------------------------------------------
 class TestBatterySettings:
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_success(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"data": {"cfgControl": {}}}
-        mock_resp.raise_for_status = MagicMock()
-        mock_session.get.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_success(self, authed_session, client):
+        mock_resp = _resp(200, {"data": {"cfgControl": {}}})
+        authed_session.get.return_value = mock_resp
 
         result = client.battery_settings()
-        assert result == {"data": {"cfgControl": {}}}
+        assert result == {"cfgControl": {}}
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_403_retry(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
+    def test_403_retry(self, authed_session, client):
+        forbidden = _resp(403)
+        success = _resp(200, {"data": {}})
 
-        forbidden = MagicMock()
-        forbidden.status_code = 403
-        forbidden.ok = False
-
-        success = MagicMock()
-        success.status_code = 200
-        success.ok = True
-        success.json.return_value = {"data": {}}
-        success.raise_for_status = MagicMock()
-
-        mock_session.get.side_effect = [forbidden, success]
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
-        mock_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
-        mock_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
-        mock_session.post.return_value = MagicMock(headers={}, cookies={})
+        authed_session.get.side_effect = [forbidden, success]
+        authed_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
+        authed_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
+        authed_session.post.return_value = _resp()
 
         # Need to patch _login to avoid real HTTP
         with patch.object(client, "_login"):
             result = client.battery_settings()
-            assert result == {"data": {}}
+            assert result == {}
 
+    def test_401_retry(self, authed_session, client):
+        unauthorized = _resp(401)
+        success = _resp(200, {"data": {}})
+        authed_session.get.side_effect = [unauthorized, success]
 
-class TestSetMode:
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_cfg_mode(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
+        with patch.object(client, "_login") as mock_login:
+            assert client.battery_settings() == {}
+            mock_login.assert_called_once()
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.raise_for_status = MagicMock()
-        mock_session.put.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+
+class TestSetMode:
+    def test_cfg_mode(self, authed_session, client):
+        mock_resp = _resp(200)
+        authed_session.put.return_value = mock_resp
 
         result = client.set_mode("cfg", True)
         assert result is True
-        call_kwargs = mock_session.put.call_args
-        payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        call_kwargs = authed_session.put.call_args
+        payload = _sent_payload(call_kwargs)
         # CFG payload is NOT wrapped in cfgControl — sent at top level
         assert payload["chargeFromGrid"] is True
         assert "acceptedItcDisclaimer" in payload
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_dtg_mode_with_times(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.raise_for_status = MagicMock()
-        mock_session.put.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_dtg_mode_with_times(self, authed_session, client):
+        mock_resp = _resp(200)
+        authed_session.put.return_value = mock_resp
 
         result = client.set_mode("dtg", True, start_time="08:00", end_time="20:00")
         assert result is True
-        call_kwargs = mock_session.put.call_args
-        payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        call_kwargs = authed_session.put.call_args
+        payload = _sent_payload(call_kwargs)
         assert "dtgControl" in payload
         assert payload["dtgControl"]["enabled"] is True
         assert payload["dtgControl"]["startTime"] == 480
         assert payload["dtgControl"]["endTime"] == 1200
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_rbd_mode(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.raise_for_status = MagicMock()
-        mock_session.put.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_rbd_mode(self, authed_session, client):
+        mock_resp = _resp(200)
+        authed_session.put.return_value = mock_resp
 
         result = client.set_mode("rbd", False)
         assert result is True
-        call_kwargs = mock_session.put.call_args
-        payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        call_kwargs = authed_session.put.call_args
+        payload = _sent_payload(call_kwargs)
         assert "rbdControl" in payload
         assert payload["rbdControl"]["enabled"] is False
 
@@ -263,29 +302,14 @@ class TestSetMode:
         with pytest.raises(ValueError, match="Invalid mode"):
             client.set_mode("invalid", True)
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_403_retry(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
+    def test_403_retry(self, authed_session, client):
+        forbidden = _resp(403, text="Forbidden")
+        success = _resp(200, text="OK")
 
-        forbidden = MagicMock()
-        forbidden.status_code = 403
-        forbidden.ok = False
-        forbidden.text = "Forbidden"
-
-        success = MagicMock()
-        success.status_code = 200
-        success.ok = True
-        success.raise_for_status = MagicMock()
-        success.text = "OK"
-
-        mock_session.put.side_effect = [forbidden, success]
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
-        mock_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
-        mock_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
-        mock_session.post.return_value = MagicMock(headers={}, cookies={})
+        authed_session.put.side_effect = [forbidden, success]
+        authed_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
+        authed_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
+        authed_session.post.return_value = _resp()
 
         with patch.object(client, "_login"):
             result = client.set_mode("rbd", True)
@@ -293,45 +317,21 @@ class TestSetMode:
 
 
 class TestGetSchedules:
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_success(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"data": {"cfg": {"details": []}}}
-        mock_resp.raise_for_status = MagicMock()
-        mock_session.get.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_success(self, authed_session, client):
+        mock_resp = _resp(200, {"data": {"cfg": {"details": []}}})
+        authed_session.get.return_value = mock_resp
 
         result = client.get_schedules()
-        assert "data" in result
-
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_403_retry(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        forbidden = MagicMock()
-        forbidden.status_code = 403
+        assert result == {"cfg": {"details": []}}
 
-        success = MagicMock()
-        success.status_code = 200
-        success.ok = True
-        success.json.return_value = {}
-        success.raise_for_status = MagicMock()
+    def test_403_retry(self, authed_session, client):
+        forbidden = _resp(403)
+        success = _resp(200, {})
 
-        mock_session.get.side_effect = [forbidden, success]
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
-        mock_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
-        mock_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
-        mock_session.post.return_value = MagicMock(headers={}, cookies={})
+        authed_session.get.side_effect = [forbidden, success]
+        authed_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
+        authed_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
+        authed_session.post.return_value = _resp()
 
         with patch.object(client, "_login"):
             result = client.get_schedules()
@@ -339,137 +339,97 @@ class TestGetSchedules:
 
 
 class TestAddSchedule:
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_success(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"scheduleId": "new-id"}
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.text = '{"scheduleId": "new-id"}'
-        mock_session.post.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_success(self, authed_session, client):
+        mock_resp = _resp(200, {"scheduleId": "new-id"}, text='{"scheduleId": "new-id"}')
+        authed_session.post.return_value = mock_resp
 
         result = client.add_schedule("cfg", "06:00", "10:00", 80, [1, 2, 3])
         assert result["scheduleId"] == "new-id"
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_schedule_type_uppercased(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.json.return_value = {}
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.text = "{}"
-        mock_session.post.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_schedule_type_uppercased(self, authed_session, client):
+        mock_resp = _resp(200, {}, text="{}")
+        authed_session.post.return_value = mock_resp
 
         client.add_schedule("cfg", "06:00", "10:00", 80, [1])
-        call_kwargs = mock_session.post.call_args
-        payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        call_kwargs = authed_session.post.call_args
+        payload = _sent_payload(call_kwargs)
         assert payload["scheduleType"] == "CFG"
 
 
 class TestDeleteSchedule:
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_success(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.text = "OK"
-        mock_session.post.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_success(self, authed_session, client):
+        mock_resp = _resp(200, text="OK")
+        authed_session.post.return_value = mock_resp
 
         result = client.delete_schedule("sched-123")
         assert result is True
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_403_retry(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
+    def test_403_retry(self, authed_session, client):
+        forbidden = _resp(403, text="Forbidden")
+        success = _resp(200, text="OK")
+
+        authed_session.post.side_effect = [forbidden, success]
+
+        with patch.object(client, "_login") as mock_login:
+            mock_login.side_effect = lambda: setattr(client, "xsrf_token", "new-xsrf")
+            result = client.delete_schedule("sched-456")
+            assert result is True
 
-        forbidden = MagicMock()
-        forbidden.status_code = 403
-        forbidden.text = "Forbidden"
+        assert authed_session.post.call_count == 2
+        retry_headers = authed_session.post.call_args_list[1].kwargs["headers"]
+        assert retry_headers["cookie"] == "locale=en; BP-XSRF-Token=new-xsrf;"
 
-        success = MagicMock()
-        success.status_code = 200
-        success.ok = True
-        success.raise_for_status = MagicMock()
-        success.text = "OK"
 
-        mock_session.post.side_effect = [forbidden, MagicMock(headers={}, cookies={}), success]
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
-        mock_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
-        mock_session.cookies.__getitem__ = lambda self, key: "new-xsrf"
-        mock_session.get.return_value = MagicMock(
-            url="https://enlighten.enphaseenergy.com/web/12345",
-            json=MagicMock(return_value={"app": {"userId": "12345"}}),
-            ok=True,
+class TestBulkSchedules:
+    def test_delete_bulk_preserves_order_and_errors(self, client):
+        err = RuntimeError("boom")
+
+        def _delete(schedule_id):
+            if schedule_id == "b":
+                raise err
+            return True
+
+        with patch.object(client, "_ensure_tokens") as mock_tokens, \
+                patch.object(client, "delete_schedule", side_effect=_delete):
+            results = client.delete_schedules_bulk(["a", "b", "c"])
+
+        mock_tokens.assert_called_once()
+        assert results == [True, err, True]
+
+    def test_add_bulk_passes_kwargs(self, client):
+        with patch.object(client, "_ensure_tokens"), \
+                patch.object(client, "add_schedule", return_value={"ok": 1}) as mock_add:
+            results = client.add_schedules_bulk([
+                {"schedule_type": "cfg", "start_time": "01:00", "end_time": "02:00",
+                 "limit": 90, "days": [1]},
+            ])
+
+        assert results == [{"ok": 1}]
+        mock_add.assert_called_once_with(
+            schedule_type="cfg", start_time="01:00", end_time="02:00", limit=90, days=[1]
         )
 
-        with patch.object(client, "_login"):
-            result = client.delete_schedule("sched-456")
-            assert result is True
+    def test_empty_skips_auth(self, client):
+        with patch.object(client, "_ensure_tokens") as mock_tokens:
+            assert client.delete_schedules_bulk([]) == []
+        mock_tokens.assert_not_called()
 
 
 class TestValidateSchedule:
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_success(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"valid": True}
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.text = '{"valid": true}'
-        mock_session.post.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_success(self, authed_session, client):
+        mock_resp = _resp(200, {"valid": True}, text='{"valid": true}')
+        authed_session.post.return_value = mock_resp
 
         result = client.validate_schedule("dtg")
         assert result["valid"] is True
 
-    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_cfg_with_force_opted(self, mock_session, client):
-        client.jwt_token = "jwt"
-        client.xsrf_token = "xsrf"
-        client.jwt_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.ok = True
-        mock_resp.json.return_value = {"valid": True}
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.text = '{"valid": true}'
-        mock_session.post.return_value = mock_resp
-        mock_session.cookies = MagicMock()
-        mock_session.cookies.__bool__ = lambda self: True
+    def test_cfg_with_force_opted(self, authed_session, client):
+        mock_resp = _resp(200, {"valid": True}, text='{"valid": true}')
+        authed_session.post.return_value = mock_resp
 
         client.validate_schedule("cfg", force_opted=True)
-        call_kwargs = mock_session.post.call_args
-        payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        call_kwargs = authed_session.post.call_args
+        payload = _sent_payload(call_kwargs)
         assert payload["scheduleType"] == "CFG"
         assert payload["forceScheduleOpted"] is True
 
@@ -492,9 +452,8 @@ class TestEnsureTokens:
 
     @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
     def test_force_refresh(self, mock_session, client):
-        future_exp = int(datetime.now(timezone.utc).timestamp()) + 7200
-        client.jwt_token = _make_jwt(exp=future_exp)
-        client.jwt_exp = future_exp
+        client.jwt_token = _VALID_JWT
+        client.jwt_exp = _FAR_FUTURE_EXP
         client.xsrf_token = "xsrf"
         mock_session.cookies = MagicMock()
         mock_session.cookies.__bool__ = lambda self: True
@@ -505,68 +464,252 @@ class TestEnsureTokens:
                 client._ensure_tokens(force_refresh=True)
                 mock_login.assert_called_once()
 
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_refreshes_xsrf_past_ttl(self, mock_session, client):
+        client.jwt_token = _VALID_JWT
+        client.jwt_exp = _FAR_FUTURE_EXP
+        client.xsrf_token = "xsrf"
+        mock_session.cookies = MagicMock()
+        mock_session.cookies.__bool__ = lambda self: True
+
+        with patch.object(client, "_update_xsrf") as mock_update:
+            client._xsrf_fetched_at = _time.monotonic()
+            client._ensure_tokens()
+            mock_update.assert_not_called()
+
+            client._xsrf_fetched_at = _time.monotonic() - 3600
+            client._tokens_ok_until = 0.0
+            client._ensure_tokens()
+            mock_update.assert_called_once()
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_recent_check_skips_validation(self, mock_session, client):
+        client.jwt_token = _VALID_JWT
+        client.jwt_exp = _FAR_FUTURE_EXP
+        client.xsrf_token = "xsrf"
+        mock_session.cookies = MagicMock()
+        mock_session.cookies.__bool__ = lambda self: True
+
+        with patch.object(client, "_jwt_valid", wraps=client._jwt_valid) as mock_valid:
+            client._ensure_tokens()
+            client._ensure_tokens()
+            assert mock_valid.call_count == 1
+
+            client._ensure_tokens(force_refresh=False)
+            client._tokens_ok_until = 0.0
+            client._ensure_tokens()
+            assert mock_valid.call_count == 2
+
+
+class TestCsrfLoginToken:
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_attribute_order_independent(self, mock_session, client):
+        mock_session.get.return_value = _resp(
+            encoding="utf-8",
+            content=b'<form><input value="tok" type="hidden" name="authenticity_token"></form>',
+        )
+        assert client._csrf_login_token() == "tok"
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_unknown_charset_falls_back_to_utf8(self, mock_session, client):
+        mock_session.get.return_value = _resp(
+            encoding="x-no-such-charset",
+            content=b'<input name="authenticity_token" value="tok">',
+        )
+        assert client._csrf_login_token() == "tok"
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_missing_token_raises(self, mock_session, client):
+        mock_session.get.return_value = _resp(content=b"<form></form>")
+        with pytest.raises(AuthError):
+            client._csrf_login_token()
+
+
+class TestLogin:
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_reuses_redirect_and_xsrf_cookie(self, mock_session, client):
+        client.user_id = None
+        client.battery_id = None
+        login_page = _resp(content=b'<input name="authenticity_token" value="tok">')
+        jwt_resp = _resp(200, {"token": _make_jwt(exp=1)})
+        app_resp = _resp(200, {"app": {"userId": "12345"}})
+        mock_session.get.side_effect = [login_page, jwt_resp, app_resp]
+        mock_session.post.return_value = _resp(url="https://enlighten.enphaseenergy.com/web/67890")
+        mock_session.cookies = MagicMock()
+        mock_session.cookies.__contains__ = lambda self, key: key == "BP-XSRF-Token"
+        mock_session.cookies.__getitem__ = lambda self, key: "login-xsrf"
+
+        with patch.object(client, "_update_xsrf") as mock_update:
+            client._login()
+            mock_update.assert_not_called()
+
+        assert client.xsrf_token == "login-xsrf"
+        assert (client.user_id, client.battery_id) == ("12345", "67890")
+        # login page, JWT and app data only — no extra home page request
+        assert mock_session.get.call_count == 3
+        mock_session.post.assert_called_once()
+
+
+class TestDiscoverIds:
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_known_ids_skip_requests(self, mock_session, client):
+        client._discover_ids()
+        mock_session.get.assert_not_called()
+
+    def test_malformed_stored_ids_dropped(self):
+        client = EnphaseClient("test@example.com", "secret", "abc", "site-1")
+        assert (client.user_id, client.battery_id) == (None, None)
+
+
+class TestApiUrls:
+    def test_cached_until_ids_change(self, client):
+        settings, schedules, is_valid = client._api_urls()
+        assert settings.endswith("/batterySettings/67890?userId=12345&source=enho")
+        assert schedules.endswith("/battery/sites/67890/schedules")
+        assert is_valid == f"{schedules}/isValid"
+        assert client._api_urls()[1] is schedules
+
+        client.battery_id = "99999"
+        assert client._api_urls()[1].endswith("/battery/sites/99999/schedules")
+
+
+class TestUpdateXsrf:
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_reads_token_from_response_cookies(self, mock_session, client):
+        client.jwt_token = "jwt"
+        mock_session.post.return_value = _resp(cookies={"BP-XSRF-Token": "fresh"})
+
+        client._update_xsrf()
+
+        assert client.xsrf_token == "fresh"
+        mock_session.cookies.get.assert_not_called()
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_raises_without_token(self, mock_session, client):
+        client.jwt_token = "jwt"
+        mock_session.post.return_value = _resp()
+        mock_session.cookies.get.return_value = None
+
+        with pytest.raises(AuthError):
+            client._update_xsrf()
+        mock_session.cookies.get.assert_called_once_with(
+            "BP-XSRF-Token", domain="enlighten.enphaseenergy.com"
+        )
+
 
 class TestLoadCache:
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "auth.json"
+        monkeypatch.setattr(
+            "custom_components.enphase_envoy_cloud_control.enphase_client.CACHE_FILE",
+            str(path),
+        )
+        return path
+
     @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    @patch("os.path.exists", return_value=True)
-    @patch(
-        "builtins.open",
-        new_callable=lambda: lambda: MagicMock(
-            __enter__=lambda s: MagicMock(
-                read=lambda: json.dumps(
-                    {"jwt": "cached_jwt", "xsrf": "cached_xsrf", "cookies": {}, "jwt_exp": 999}
-                )
-            ),
-            __exit__=lambda s, *a: None,
-        ),
-    )
-    def test_loads_cached_values(self, mock_open, mock_exists, mock_session, client):
+    def test_loads_cached_values(self, mock_session, client, cache_file):
         """Verify load_cache populates client attributes from cache file."""
-        # Use a simpler approach — just patch the json.load
-        import json as _json
-
-        cache_data = {
+        cache_file.write_text(json.dumps({
             "jwt": "cached_jwt",
             "xsrf": "cached_xsrf",
             "cookies": {"key": "value"},
             "jwt_exp": 999,
             "user_id": "111",
             "battery_id": "222",
-        }
+        }))
         client.user_id = None
         client.battery_id = None
 
-        with patch("builtins.open", MagicMock()):
-            with patch("json.load", return_value=cache_data):
-                mock_session.cookies = MagicMock()
-                client.load_cache()
-                assert client.jwt_token == "cached_jwt"
-                assert client.xsrf_token == "cached_xsrf"
-                assert client.jwt_exp == 999
-                assert client.user_id == "111"
-                assert client.battery_id == "222"
+        client.load_cache()
+        assert client.jwt_token == "cached_jwt"
+        assert client.xsrf_token == "cached_xsrf"
+        assert client.jwt_exp == 999
+        assert client.user_id == "111"
+        assert client.battery_id == "222"
+        mock_session.cookies.set.assert_called_once_with(
+            "key", "value", domain="enlighten.enphaseenergy.com", path="/"
+        )
 
     @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    @patch("os.path.exists", return_value=False)
-    def test_no_cache_file(self, mock_exists, mock_session, client):
+    def test_no_cache_file(self, mock_session, client):
         """No error when cache file doesn't exist."""
         client.load_cache()
         assert client.jwt_token is None
 
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_loaded_lazily_on_first_auth(self, mock_session, cache_file):
+        cache_file.write_text(json.dumps({
+            "jwt": _VALID_JWT,
+            "xsrf": "cached_xsrf",
+            "jwt_exp": _FAR_FUTURE_EXP,
+        }))
+        mock_session.cookies = MagicMock()
+        mock_session.cookies.__bool__ = lambda self: True
+
+        lazy = EnphaseClient("test@example.com", "secret", "12345", "67890")
+        assert lazy.jwt_token is None
+
+        with patch.object(lazy, "load_cache", wraps=lazy.load_cache) as mock_load:
+            lazy._ensure_tokens()
+            lazy._ensure_tokens()
+            mock_load.assert_called_once()
+        assert lazy.xsrf_token == "cached_xsrf"
+
 
 class TestSaveCache:
+    @pytest.fixture(autouse=True)
+    def cache_paths(self, tmp_path, monkeypatch):
+        module = "custom_components.enphase_envoy_cloud_control.enphase_client"
+        monkeypatch.setattr(f"{module}.CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(f"{module}.CACHE_FILE", str(tmp_path / "auth.json"))
+        return tmp_path
+
     @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
-    def test_writes_cache(self, mock_session, client):
+    def test_writes_cache(self, mock_session, client, cache_paths):
         client.jwt_token = "jwt"
         client.xsrf_token = "xsrf"
         client.jwt_exp = 12345
         mock_session.cookies = MagicMock()
 
-        with patch("builtins.open", MagicMock()) as mock_open:
-            with patch("json.dump") as mock_dump:
-                with patch("os.makedirs"):
-                    client._save_cache()
-                    mock_dump.assert_called_once()
-                    data = mock_dump.call_args[0][0]
-                    assert data["jwt"] == "jwt"
-                    assert data["xsrf"] == "xsrf"
+        client._save_cache()
+
+        data = json.loads((cache_paths / "auth.json").read_text())
+        assert data["jwt"] == "jwt"
+        assert data["xsrf"] == "xsrf"
+        assert [p.name for p in cache_paths.iterdir()] == ["auth.json"]
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_persists_only_enphase_cookies(self, mock_session, client, cache_paths):
+        mock_session.cookies = [
+            SimpleNamespace(name="BP-XSRF-Token", domain="enlighten.enphaseenergy.com", value="x"),
+            SimpleNamespace(name="session", domain=".enphaseenergy.com", value="s"),
+            SimpleNamespace(name="ad", domain="tracker.example.com", value="t"),
+        ]
+
+        client._save_cache()
+
+        data = json.loads((cache_paths / "auth.json").read_text())
+        assert data["cookies"] == {"BP-XSRF-Token": "x", "session": "s"}
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_skips_unchanged_content(self, mock_session, client):
+        client.jwt_token = "jwt"
+        mock_session.cookies = MagicMock()
+
+        client._save_cache()
+        with patch("os.replace") as mock_replace:
+            client._save_cache()
+            mock_replace.assert_not_called()
+
+    @patch("custom_components.enphase_envoy_cloud_control.enphase_client.SESSION")
+    def test_ensure_tokens_skips_save_when_clean(self, mock_session, client):
+        client.jwt_token = _VALID_JWT
+        client.jwt_exp = _FAR_FUTURE_EXP
+        client.xsrf_token = "xsrf"
+        mock_session.cookies = MagicMock()
+        mock_session.cookies.__bool__ = lambda self: True
+
+        with patch.object(client, "_save_cache") as mock_save:
+            client._ensure_tokens()
+            mock_save.assert_not_called()
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
+from homeassistant.exceptions import HomeAssistantError
+
 from custom_components.enphase_envoy_cloud_control import (
-    _collect_schedules,
+    _async_raise_on_delete_failures,
     _mode_settings_from_data,
     _normalize_schedule_ids,
 )
@@ -16,6 +19,7 @@ from custom_components.enphase_envoy_cloud_control import (
 # ---------------------------------------------------------------------------
 # _normalize_schedule_ids
 # ---------------------------------------------------------------------------
+@pytest.mark.pure
 class TestNormalizeScheduleIds:
     def test_none_returns_empty(self):
         assert _normalize_schedule_ids(None) == []
@@ -61,63 +65,13 @@ class TestNormalizeScheduleIds:
         assert "cd" in result
 
 
-# ---------------------------------------------------------------------------
-# _collect_schedules
-# ---------------------------------------------------------------------------
-class TestCollectSchedules:
-    def _make_coordinator(self, data):
-        coord = MagicMock()
-        coord.data = data
-        coord.client = MagicMock(spec=[])
-        return coord
-
-    def test_primary_path(self):
-        coord = self._make_coordinator({
-            "data": {
-                "cfgControl": {"schedules": [{"scheduleId": "s1"}]}
-            }
-        })
-        assert _collect_schedules(coord, "cfg") == [{"scheduleId": "s1"}]
-
-    def test_fallback_dict_details(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {"dtg": {"details": [{"scheduleId": "s2"}]}},
-        })
-        assert _collect_schedules(coord, "dtg") == [{"scheduleId": "s2"}]
-
-    def test_fallback_list(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {"rbd": [{"scheduleId": "s3"}]},
-        })
-        assert _collect_schedules(coord, "rbd") == [{"scheduleId": "s3"}]
-
-    def test_fallback_data_inner(self):
-        coord = self._make_coordinator({
-            "data": {},
-            "schedules": {"data": {"cfg": {"details": [{"scheduleId": "s4"}]}}},
-        })
-        assert _collect_schedules(coord, "cfg") == [{"scheduleId": "s4"}]
-
-    def test_client_cache_fallback(self):
-        coord = self._make_coordinator({"data": {}})
-        coord.client._last_schedules = {"cfg": [{"scheduleId": "s5"}]}
-        assert _collect_schedules(coord, "cfg") == [{"scheduleId": "s5"}]
-
-    def test_empty_returns_empty(self):
-        coord = self._make_coordinator(None)
-        assert _collect_schedules(coord, "cfg") == []
-
-
 # ---------------------------------------------------------------------------
 # _mode_settings_from_data
 # ---------------------------------------------------------------------------
+@pytest.mark.pure
 class TestModeSettingsFromData:
     def _make_coordinator(self, data):
-        coord = MagicMock()
-        coord.data = data
-        return coord
+        return SimpleNamespace(data=data)
 
     def test_cfg_mode(self):
         coord = self._make_coordinator({
@@ -158,3 +112,23 @@ class TestModeSettingsFromData:
         coord = self._make_coordinator(None)
         result = _mode_settings_from_data(coord, "cfg")
         assert result == {}
+
+
+# ---------------------------------------------------------------------------
+# _async_raise_on_delete_failures
+# ---------------------------------------------------------------------------
+class TestRaiseOnDeleteFailures:
+    @pytest.mark.asyncio
+    async def test_all_deleted(self):
+        coord = SimpleNamespace(async_request_refresh=AsyncMock())
+        await _async_raise_on_delete_failures(coord, ["a", "b"], [True, True])
+        coord.async_request_refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_refreshes_then_raises(self):
+        coord = SimpleNamespace(async_request_refresh=AsyncMock())
+        with pytest.raises(HomeAssistantError, match=r"Failed to delete schedule b: boom \(deleted: a, c\)"):
+            await _async_raise_on_delete_failures(
+                coord, ["a", "b", "c"], [True, RuntimeError("boom"), True]
+            )
+        coord.async_request_refresh.assert_awaited_once()
@@ -49,6 +49,29 @@ class TestScheduleSelect:
         await select.async_select_option("nonexistent-id")
         assert editor_state["selected_schedule_id"] == "nonexistent-id"
 
+    def test_options_rebuilt_on_coordinator_update(self, select, mock_coordinator):
+        select.async_write_ha_state = MagicMock()
+        module = "custom_components.enphase_envoy_cloud_control.select.normalize_schedules"
+        with patch(module, return_value=[{"id": "a"}]) as norm:
+            select._handle_coordinator_update()
+            norm.assert_not_called()  # same data object, cached options reused
+            mock_coordinator.data = dict(mock_coordinator.data)
+            select._handle_coordinator_update()
+            select._handle_coordinator_update()
+            assert norm.call_count == 1
+        assert select.options == ["a"]
+        assert select.async_write_ha_state.call_count == 3
+
+    def test_options_rebuilt_after_background_fetch(self, select, mock_coordinator):
+        select.async_write_ha_state = MagicMock()
+        module = "custom_components.enphase_envoy_cloud_control.select.normalize_schedules"
+        with patch(module, return_value=[{"id": "fetched"}]) as norm:
+            # Same data object; only the client's schedule cache is filled in.
+            mock_coordinator.client._last_schedules = {"cfg": [{"scheduleId": "fetched"}]}
+            select._handle_coordinator_update()
+            assert norm.call_count == 1
+        assert select.options == ["fetched"]
+
     def test_device_info(self, select):
         info = select.device_info
         assert "identifiers" in info
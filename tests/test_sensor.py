@@ -12,6 +12,7 @@ from custom_components.enphase_envoy_cloud_control.sensor import (
     EnphaseScheduleSensor,
     EnphaseSchedulesSummarySensor,
     EnphaseTimedModeActiveSensor,
+    _mode_schedules,
 )
 
 from .conftest import ENTRY_ID, SAMPLE_COORDINATOR_DATA
@@ -68,7 +69,7 @@ class TestBatteryModesSensor:
             2025, 1, 1, 12, 0, tzinfo=timezone.utc
         )
         attrs = battery_sensor.extra_state_attributes
-        assert "last_successful_poll" in attrs
+        assert attrs["last_successful_poll"] == "2025-01-01T12:00:00+00:00"
 
     def test_extra_state_attributes_empty_data(self, battery_sensor):
         battery_sensor.coordinator.data = None
@@ -76,6 +77,13 @@ class TestBatteryModesSensor:
         # Should not crash — returns partial attrs or error
         assert isinstance(attrs, dict)
 
+    def test_extra_state_attributes_cached_until_update(self, battery_sensor):
+        battery_sensor.async_write_ha_state = MagicMock()
+        attrs = battery_sensor.extra_state_attributes
+        assert battery_sensor.extra_state_attributes is attrs
+        battery_sensor._handle_coordinator_update()
+        assert battery_sensor.extra_state_attributes is not attrs
+
     def test_device_info(self, battery_sensor):
         info = battery_sensor.device_info
         assert "identifiers" in info
@@ -97,6 +105,23 @@ class TestSchedulesSummarySensor:
         assert isinstance(attrs["schedules"], list)
         assert "last_refresh" in attrs
 
+    def test_extra_state_attributes_cached_until_update(self, summary_sensor):
+        summary_sensor.async_write_ha_state = MagicMock()
+        attrs = summary_sensor.extra_state_attributes
+        assert summary_sensor.extra_state_attributes is attrs
+        summary_sensor._handle_coordinator_update()
+        assert summary_sensor.extra_state_attributes is not attrs
+
+    def test_reads_do_not_renormalize(self, summary_sensor, mock_coordinator):
+        summary_sensor.async_write_ha_state = MagicMock()
+        module = "custom_components.enphase_envoy_cloud_control.sensor.normalize_schedules"
+        with patch(module, return_value=[{"id": "a"}, {"id": "b"}]) as norm:
+            summary_sensor._handle_coordinator_update()
+            assert summary_sensor.native_value == "2"
+            assert summary_sensor.native_value == "2"
+            summary_sensor.extra_state_attributes
+            norm.assert_called_once_with(mock_coordinator)
+
     def test_unique_id(self, summary_sensor):
         assert summary_sensor._attr_unique_id == f"{ENTRY_ID}_schedules_summary"
 
@@ -180,6 +205,31 @@ class TestScheduleSensor:
         scheds = sensor._schedules()
         assert len(scheds) == 1
 
+    def test_schedules_resolved_once_per_update(self, schedule_sensor, mock_coordinator):
+        first = schedule_sensor._schedules()
+        assert schedule_sensor._schedules() is first
+        mock_coordinator.data = {"data": {"cfgControl": {"schedules": []}}}
+        assert schedule_sensor._schedules() == []
+
+
+# ---------------------------------------------------------------------------
+# _mode_schedules
+# ---------------------------------------------------------------------------
+class TestModeSchedules:
+    def test_details_block(self):
+        assert _mode_schedules({"cfg": {"details": [{"scheduleId": "a"}]}}, "cfg") == [{"scheduleId": "a"}]
+
+    def test_plain_list(self):
+        assert _mode_schedules({"cfg": [{"scheduleId": "a"}]}, "cfg") == [{"scheduleId": "a"}]
+
+    def test_nested_data(self):
+        root = {"cfg": {}, "data": {"cfg": {"details": [{"scheduleId": "b"}]}}}
+        assert _mode_schedules(root, "cfg") == [{"scheduleId": "b"}]
+
+    def test_missing(self):
+        assert _mode_schedules({"dtg": []}, "cfg") is None
+        assert _mode_schedules(None, "cfg") is None
+
 
 # ---------------------------------------------------------------------------
 # EnphaseTimedModeActiveSensor
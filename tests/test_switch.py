@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -53,15 +53,15 @@ class TestModeSwitch:
 
     @pytest.mark.asyncio
     async def test_turn_on(self, cfg_switch):
-        with patch("custom_components.enphase_envoy_cloud_control.switch.asyncio.sleep", new_callable=AsyncMock):
-            await cfg_switch.async_turn_on()
+        await cfg_switch.async_turn_on()
         cfg_switch.coordinator.client.set_mode.assert_called_with("cfgControl", True)
+        cfg_switch.coordinator.async_request_settled_refresh.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_turn_off(self, cfg_switch):
-        with patch("custom_components.enphase_envoy_cloud_control.switch.asyncio.sleep", new_callable=AsyncMock):
-            await cfg_switch.async_turn_off()
+        await cfg_switch.async_turn_off()
         cfg_switch.coordinator.client.set_mode.assert_called_with("cfgControl", False)
+        cfg_switch.coordinator.async_request_settled_refresh.assert_awaited_once()
 
     def test_device_info(self, cfg_switch):
         info = cfg_switch.device_info
@@ -69,6 +69,13 @@ class TestScheduleTime:
         result = edit_start.native_value
         assert result == time(14, 0)
 
+    def test_reparses_only_on_change(self, edit_start, editor_state):
+        editor_state["start_time"] = "08:30"
+        first = edit_start.native_value
+        assert edit_start.native_value is first
+        editor_state["start_time"] = "09:15"
+        assert edit_start.native_value == time(9, 15)
+
     @pytest.mark.asyncio
     async def test_writes_hhmm_format(self, edit_start, editor_state):
         edit_start.async_write_ha_state = MagicMock()
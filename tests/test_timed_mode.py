@@ -267,17 +267,21 @@ class TestCancelAllTimedModes:
             with patch(
                 "custom_components.enphase_envoy_cloud_control.timed_mode._save_store",
                 new_callable=AsyncMock,
-            ):
+            ) as mock_save:
                 with patch(
                     "custom_components.enphase_envoy_cloud_control.timed_mode._clear_store",
                     new_callable=AsyncMock,
                 ) as mock_clear:
                     with patch(
                         "custom_components.enphase_envoy_cloud_control.timed_mode.async_call_later"
-                    ):
+                    ) as mock_later:
                         await cancel_all_timed_modes(hass_with_timed, ENTRY_ID)
 
         mock_clear.assert_called_once()
+        # One store write and one refresh for the whole batch
+        mock_save.assert_not_called()
+        mock_later.assert_called_once()
+        assert timed == {}
         # Both schedules should be deleted
         assert mock_coordinator.client.delete_schedule.call_count == 2
 